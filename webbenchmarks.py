@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebBenchmark Objects
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+import tracemalloc
+import lxml.html
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from webscraping.weburl import WebAddress, WebParameters, WebCURL
+from webscraping.webreaders import WebReader
+from webscraping.webdatas import WebHTML, WebHTMLText, WebHTMLTable, WebJSON, WebJSONData, WebJsonText
+from webscraping.webpayloads import WebPayloadMapping, WebPayloadValue
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebBenchmark", "WebBenchmarkServer"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebBenchmarkTitle(WebHTMLText, key="title", locator="./a"): pass
+class WebBenchmarkPrice(WebHTMLText, key="price", locator="./span[@class='price']", parser=float): pass
+class WebBenchmarkRow(WebHTML, key="row", locator="//div[@class='row']", multiple=True, dependents=[WebBenchmarkTitle, WebBenchmarkPrice]): pass
+class WebBenchmarkTable(WebHTMLTable, key="table", locator="//table"): pass
+
+class WebBenchmarkName(WebPayloadValue, key="name", locator="name"): pass
+class WebBenchmarkAmount(WebPayloadValue, key="amount", locator="amount", parser=lambda value: f"{float(value):.2f}"): pass
+class WebBenchmarkOrder(WebPayloadMapping, dependents=[WebBenchmarkName, WebBenchmarkAmount], mapping={"type": "order"}): pass
+
+
+class WebBenchmarkDocuments(object):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def html(size, depth):
+        row = lambda index: f"<div class='row'><a href='/item/{index}'>Item {index}</a><span class='price'>{index * 1.25:.2f}</span></div>"
+        rows = "".join([row(index) for index in range(int(size))])
+        for level in range(int(depth)): rows = f"<div class='level{level}'>{rows}</div>"
+        return f"<html><body>{rows}</body></html>".encode("utf-8")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def json(size, depth):
+        def nested(index):
+            content = dict(value=index * 1.25)
+            for level in reversed(range(int(depth))): content = {f"level{level}": content}
+            return content
+        records = [dict(id=index, name=f"Item {index}", nested=nested(index)) for index in range(int(size))]
+        return json.dumps(dict(data=records)).encode("utf-8")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def table(size, depth):
+        columns = max(int(depth), 1)
+        header = "".join([f"<th>column{column}</th>" for column in range(columns)])
+        row = lambda index: "".join([f"<td>{index * (column + 1)}</td>" for column in range(columns)])
+        rows = "".join([f"<tr>{row(index)}</tr>" for index in range(int(size))])
+        return f"<html><body><table><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table></body></html>".encode("utf-8")
+
+
+class WebBenchmarkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        parameters = {key: int(values[0]) for key, values in parse_qs(url.query).items()}
+        kind = str(url.path).strip("/")
+        if kind not in ("html", "json", "table"):
+            self.send_error(404)
+            return
+        content = getattr(WebBenchmarkDocuments, kind)(parameters.get("size", 10), parameters.get("depth", 1))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json" if kind == "json" else "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args, **kwargs): pass
+
+
+class WebBenchmarkServer(object):
+    def __init__(self, *args, host="127.0.0.1", port=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__server = ThreadingHTTPServer((str(host), int(port)), WebBenchmarkHandler)
+        self.__thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def url(self, kind, size, depth):
+        address = WebAddress(self.domain, [str(kind)])
+        parameters = WebParameters(dict(size=int(size), depth=int(depth)).items())
+        return WebCURL(address, parameters, {})
+
+    @property
+    def domain(self): return "http://{}:{}".format(*self.server.server_address[:2])
+    @property
+    def server(self): return self.__server
+    @property
+    def thread(self): return self.__thread
+
+
+class WebBenchmark(object):
+    def __init__(self, *args, sizes=(10, 100, 1000), depths=(1, 4, 16), repeat=5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__sizes = tuple(map(int, sizes))
+        self.__depths = tuple(map(int, depths))
+        self.__repeat = int(repeat)
+
+    def __call__(self, *args, **kwargs):
+        with WebBenchmarkServer() as server, WebReader() as reader:
+            for size in self.sizes:
+                for depth in self.depths:
+                    yield from self.execute(server, reader, size, depth)
+
+    def execute(self, server, reader, size, depth):
+        html = lxml.html.fromstring(WebBenchmarkDocuments.html(size, depth))
+        table = lxml.html.fromstring(WebBenchmarkDocuments.table(size, depth))
+        records = json.loads(WebBenchmarkDocuments.json(size, depth))["data"]
+        keys = ["nested"] + [f"level{level}" for level in range(depth)] + ["value"]
+        locator = "/".join(keys)
+        value = type(f"WebBenchmarkValue{depth}", tuple([WebJsonText]), dict(), key="value", locator=locator, parser=float)
+        record = type(f"WebBenchmarkRecord{depth}", tuple([WebJSON]), dict(), key="record", locator="data", multiple=True, dependents=[value])
+        payloads = [dict(name=f"Item {index}", amount=index * 1.25) for index in range(size)]
+        columns = dict(name=[payload["name"] for payload in payloads], amount=[payload["amount"] for payload in payloads])
+        url = lambda kind: server.url(kind, size, depth)
+        stages = dict()
+        stages["WebReader.load"] = (lambda: reader.load(url("html")), 1)
+        stages["WebHTMLData.locate"] = (lambda: list(WebBenchmarkRow.locate(html)), size)
+        stages["WebHTML.execute"] = (lambda: [row() for row in WebBenchmarkRow(html)], size)
+        stages["WebDataPlan.execute"] = (lambda: WebBenchmarkRow.plan(html), size)
+        stages["WebJSONData.retrieve"] = (lambda: [WebJSONData.retrieve(content, keys) for content in records], size)
+        stages["WebJSON.execute"] = (lambda: [instance() for instance in record(dict(data=records))], size)
+        stages["WebHTMLTable.table"] = (lambda: WebBenchmarkTable(table)(), size)
+        stages["WebPayloadMeta.__call__"] = (lambda: [WebBenchmarkOrder(payload) for payload in payloads], size)
+        stages["WebPayloadBuilder.batch"] = (lambda: WebBenchmarkOrder.builder.batch(columns), size)
+        stages["WebHTML.end-to-end"] = (lambda: [row() for row in WebBenchmarkRow(reader.load(url("html")).html)], size)
+        stages["WebJSON.end-to-end"] = (lambda: [instance() for instance in record(reader.load(url("json")).json)], size)
+        self.verify(html, table)
+        for stage, (function, count) in stages.items():
+            yield self.measure(stage, function, count, size=size, depth=depth)
+
+    @staticmethod
+    def verify(html, table):
+        assert WebBenchmarkRow.plan(html) == [row() for row in WebBenchmarkRow(html)]
+        assert WebBenchmarkTable.plan(table).equals(WebBenchmarkTable(table)())
+
+    def measure(self, stage, function, count, *args, size, depth, **kwargs):
+        function()
+        reset, start = self.reset(), time.perf_counter()
+        for _ in range(self.repeat): function()
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        rss = self.peak() if bool(reset) else None
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        content = function()
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del content
+        differences = [statistic for statistic in after.compare_to(before, "filename") if statistic.count_diff > 0]
+        blocks, allocated = sum([statistic.count_diff for statistic in differences]), sum([max(statistic.size_diff, 0) for statistic in differences])
+        rates = dict(pages=self.repeat / elapsed, records=self.repeat * int(count) / elapsed)
+        results = dict(stage=str(stage), size=int(size), depth=int(depth), repeat=self.repeat, seconds=elapsed / self.repeat)
+        memory = dict(peak_rss=rss, peak_traced=int(peak), allocated_blocks=int(blocks), allocated_bytes=int(allocated))
+        return results | {f"{key}_per_second": value for key, value in rates.items()} | memory
+
+    @staticmethod
+    def reset():
+        try:
+            with open("/proc/self/clear_refs", "w") as file: file.write("5")
+        except OSError: return False
+        return True
+
+    @staticmethod
+    def peak():
+        with open("/proc/self/status", "r") as file:
+            lines = [line.split() for line in file if line.startswith("VmHWM:")]
+        return int(lines[0][1]) * 1024 if bool(lines) else None
+
+    @property
+    def sizes(self): return self.__sizes
+    @property
+    def depths(self): return self.__depths
+    @property
+    def repeat(self): return self.__repeat
+
+
+def main(*args, **kwargs):
+    parser = argparse.ArgumentParser(description="WebScraping extraction throughput benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=str, default=None)
+    arguments = parser.parse_args(*args)
+    benchmark = WebBenchmark(sizes=arguments.sizes, depths=arguments.depths, repeat=arguments.repeat)
+    stream = open(arguments.output, "w") if arguments.output is not None else sys.stdout
+    try:
+        for result in benchmark():
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+    finally:
+        if stream is not sys.stdout: stream.close()
+
+
+if __name__ == "__main__":
+    main()
+
+
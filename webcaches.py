@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebCache Objects
+@author: Jack Kirby Cook
+
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebCache"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebCache(object):
+    __schema__ = "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, url TEXT, headers TEXT, encoding TEXT, content BLOB, etag TEXT, modified TEXT, stored REAL, accessed REAL, size INTEGER)"
+
+    def __init__(self, *args, file, ttl=None, size=None, headers=("accept", "accept-language", "authorization"), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__headers = tuple([str(header).lower() for header in headers])
+        self.__ttl = float(ttl) if ttl is not None else None
+        self.__size = int(size) if size is not None else None
+        self.__counters = dict(hits=0, misses=0, stores=0, evictions=0)
+        self.__mutex = threading.Lock()
+        self.__connection = None
+        self.__file = str(file)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.close()
+
+    def open(self):
+        if self.connection is not None: return
+        connection = sqlite3.connect(self.file, check_same_thread=False)
+        connection.execute(self.__schema__)
+        connection.commit()
+        self.connection = connection
+
+    def close(self):
+        if self.connection is not None: self.connection.close()
+        self.connection = None
+
+    def key(self, url, payload=None): return self.fingerprint(url, payload=payload, headers=self.headers)
+
+    @staticmethod
+    def fingerprint(url, payload=None, headers=()):
+        address, parameters, variables = url
+        parameters = sorted([(str(key), str(value)) for key, value in dict(parameters).items()])
+        variables = sorted([(str(key).lower(), str(value)) for key, value in dict(variables).items() if str(key).lower() in headers])
+        contents = dict(address=str(address), parameters=parameters, headers=variables, payload=payload)
+        contents = json.dumps(contents, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        self.open()
+        threshold = (time.time() - self.ttl) if self.ttl is not None else float("-inf")
+        with self.mutex:
+            cursor = self.connection.execute("SELECT url, headers, encoding, content, etag, modified FROM entries WHERE key = ? AND stored >= ?", (key, threshold))
+            entry = cursor.fetchone()
+        if entry is None: return None
+        url, headers, encoding, content, etag, modified = entry
+        return dict(url=url, headers=json.loads(headers), encoding=encoding, content=bytes(content), etag=etag, modified=modified)
+
+    def put(self, key, response):
+        control = str(response.headers.get("Cache-Control", "")).lower()
+        etag, modified = response.headers.get("ETag", None), response.headers.get("Last-Modified", None)
+        with self.mutex: self.counters["misses"] = self.counters["misses"] + 1
+        if "no-store" in control or (etag is None and modified is None): return
+        self.open()
+        current, content = time.time(), bytes(response.content)
+        values = (key, str(response.url), json.dumps(dict(response.headers)), response.encoding, content, etag, modified, current, current, len(content))
+        with self.mutex:
+            self.connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            self.counters["stores"] = self.counters["stores"] + 1
+            self.expire()
+            self.evict()
+            self.connection.commit()
+
+    def hit(self, key, headers=None):
+        headers = headers if headers is not None else {}
+        etag, modified, current = headers.get("ETag", None), headers.get("Last-Modified", None), time.time()
+        with self.mutex:
+            values = (current, current, etag, modified, key)
+            self.connection.execute("UPDATE entries SET accessed = ?, stored = ?, etag = COALESCE(?, etag), modified = COALESCE(?, modified) WHERE key = ?", values)
+            self.connection.commit()
+            self.counters["hits"] = self.counters["hits"] + 1
+
+    def expire(self):
+        if self.ttl is None: return
+        cursor = self.connection.execute("DELETE FROM entries WHERE stored < ?", (time.time() - self.ttl,))
+        self.counters["evictions"] = self.counters["evictions"] + int(cursor.rowcount)
+
+    def evict(self):
+        if self.size is None: return
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.size: return
+        for key, size in self.connection.execute("SELECT key, size FROM entries ORDER BY accessed ASC").fetchall():
+            if total <= self.size: break
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.counters["evictions"] = self.counters["evictions"] + 1
+            total = total - int(size)
+
+    @staticmethod
+    def validators(entry):
+        if entry is None: return {}
+        etag = {"If-None-Match": entry["etag"]} if entry["etag"] is not None else {}
+        modified = {"If-Modified-Since": entry["modified"]} if entry["modified"] is not None else {}
+        return etag | modified
+
+    @property
+    def connection(self): return self.__connection
+    @connection.setter
+    def connection(self, connection): self.__connection = connection
+    @property
+    def counters(self): return self.__counters
+    @property
+    def headers(self): return self.__headers
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def file(self): return self.__file
+    @property
+    def size(self): return self.__size
+    @property
+    def ttl(self): return self.__ttl
+
+
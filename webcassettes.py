@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebCassette Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import json
+import zlib
+import mmap
+import threading
+from functools import cached_property
+
+from webscraping.webreaders import WebResponse
+from webscraping.webcaches import WebCache
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebCassette", "WebCassetteError"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebCassetteError(Exception): pass
+
+
+class WebRecording(WebResponse):
+    def __init__(self, view, *args, compressed, **kwargs):
+        super().__init__(None, *args, **kwargs)
+        self.__compressed = bool(compressed)
+        self.__view = view
+
+    @cached_property
+    def content(self): return zlib.decompress(self.view) if bool(self.compressed) else bytes(self.view)
+
+    @property
+    def compressed(self): return self.__compressed
+    @property
+    def view(self): return self.__view
+
+
+class WebCassette(object):
+    def __init__(self, *args, file, mode, compression=6, **kwargs):
+        super().__init__(*args, **kwargs)
+        assert mode in ("record", "replay")
+        self.__compression = int(compression)
+        self.__mutex = threading.Lock()
+        self.__mode = str(mode)
+        self.__file = str(file)
+        self.__counters = dict()
+        self.__index = dict()
+        self.__stream = None
+        self.__memory = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.close()
+
+    def open(self):
+        if self.stream is not None: return
+        exists = os.path.exists(self.file) and os.path.exists(self.file + ".index")
+        if self.mode == "replay" and not exists: raise WebCassetteError(self.file)
+        if exists:
+            with open(self.file + ".index", "r") as file: self.index.update(json.load(file))
+        self.stream = open(self.file, "ab" if self.mode == "record" else "rb")
+        if self.mode == "replay" and os.path.getsize(self.file) > 0: self.memory = mmap.mmap(self.stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self.stream is None: return
+        if self.mode == "record":
+            with open(self.file + ".index", "w") as file: json.dump(self.index, file, separators=(",", ":"))
+        if self.memory is not None:
+            try: self.memory.close()
+            except BufferError: pass
+        self.stream.close()
+        self.counters.clear()
+        self.memory = None
+        self.stream = None
+
+    def record(self, url, response, *args, payload=None, **kwargs):
+        assert self.mode == "record"
+        key = WebCache.fingerprint(url, payload=payload)
+        content = zlib.compress(bytes(response.content), self.compression) if bool(self.compression) else bytes(response.content)
+        with self.mutex:
+            offset = self.stream.seek(0, os.SEEK_END)
+            self.stream.write(content)
+            entry = dict(url=str(response.url), status=int(response.status), headers=dict(response.headers), encoding=response.encoding)
+            entry = entry | dict(offset=int(offset), length=len(content), compressed=bool(self.compression))
+            self.index.setdefault(key, []).append(entry)
+
+    def replay(self, url, *args, payload=None, **kwargs):
+        assert self.mode == "replay"
+        key = WebCache.fingerprint(url, payload=payload)
+        if key not in self.index: raise WebCassetteError(str(url))
+        with self.mutex:
+            entries, counter = self.index[key], self.counters.get(key, 0)
+            self.counters[key] = counter + 1
+        entry = entries[min(counter, len(entries) - 1)]
+        offset, length = int(entry["offset"]), int(entry["length"])
+        view = memoryview(self.memory)[offset:offset + length] if self.memory is not None else memoryview(bytes())
+        parameters = dict(url=entry["url"], status=entry["status"], headers=entry["headers"], encoding=entry["encoding"])
+        return WebRecording(view, compressed=entry["compressed"], **parameters)
+
+    @property
+    def recording(self): return self.mode == "record"
+    @property
+    def replaying(self): return self.mode == "replay"
+
+    @property
+    def compression(self): return self.__compression
+    @property
+    def counters(self): return self.__counters
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def index(self): return self.__index
+    @property
+    def mode(self): return self.__mode
+    @property
+    def file(self): return self.__file
+    @property
+    def stream(self): return self.__stream
+    @stream.setter
+    def stream(self, stream): self.__stream = stream
+    @property
+    def memory(self): return self.__memory
+    @memory.setter
+    def memory(self, memory): self.__memory = memory
+
+
@@ -6,13 +6,20 @@ Created on Mon Dec 30 2019
 
 """
 
+import re
+import sys
 import json
+import importlib
 import lxml.html
+import contextvars
 import lxml.etree
+import numpy as np
 import pandas as pd
 from numbers import Number
 from abc import ABC, ABCMeta, abstractmethod
 from collections import OrderedDict as ODict
+from types import SimpleNamespace, FunctionType
+from contextlib import nullcontext
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
@@ -20,11 +27,12 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 
+from webscraping.webinstruments import WebInstrument
 from support.meta import AttributeMeta, TreeMeta
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebELMT", "WebJSON", "WebHTML", "WebDataError"]
+__all__ = ["WebELMT", "WebJSON", "WebHTML", "WebSnapshot", "WebDataPlan", "WebDataError"]
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = "MIT License"
 
@@ -32,9 +40,112 @@ __license__ = "MIT License"
 class WebDataError(Exception): pass
 class WebDataMissingError(WebDataError): pass
 class WebDataMultipleError(WebDataError): pass
+class WebDataLocatorError(WebDataError): pass
+
+
+class WebSnapshot(object):
+    __snapshot__ = contextvars.ContextVar("snapshot", default=None)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__documents = dict()
+        self.__token = None
+
+    def __enter__(self):
+        self.token = WebSnapshot.__snapshot__.set(self)
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        WebSnapshot.__snapshot__.reset(self.token)
+        self.documents.clear()
+        self.token = None
+
+    def __call__(self, source):
+        key = self.identify(source)
+        if key not in self.documents: self.documents[key] = self.parse(source)
+        return self.documents[key]
+
+    @classmethod
+    def scope(cls):
+        snapshot = cls.__snapshot__.get()
+        return nullcontext(snapshot) if snapshot is not None else cls()
+
+    @classmethod
+    def current(cls): return cls.__snapshot__.get()
+
+    @staticmethod
+    def identify(source):
+        if isinstance(source, WebDriver): return tuple([WebDriver, source.session_id])
+        elif isinstance(source, WebElement): return tuple([WebElement, source.id])
+        else: raise TypeError(type(source))
+
+    @staticmethod
+    def parse(source):
+        if isinstance(source, WebDriver): return lxml.html.fromstring(source.page_source)
+        elif isinstance(source, WebElement): return lxml.html.fromstring(source.get_attribute("innerHTML"))
+        else: raise TypeError(type(source))
+
+    @property
+    def documents(self): return self.__documents
+    @property
+    def token(self): return self.__token
+    @token.setter
+    def token(self, token): self.__token = token
+
+
+class WebJSONPath(object):
+    def __init__(self, locator):
+        keys = str(locator).lstrip("//").rstrip("[]").split("/")
+        self.__fanout = any([key == "*" for key in keys])
+        self.__keys = tuple(keys)
+        self.__locator = locator
+
+    def __repr__(self): return f"{type(self).__name__}({self.locator!r})"
+    def __call__(self, data, default=None):
+        if not self.fanout: return self.traverse(data, self.keys, default)
+        contents = [data]
+        for key in self.keys:
+            if key == "*": contents = [value for content in contents for value in self.expand(content)]
+            else: contents = [self.access(content, key, default) for content in contents]
+        return contents
+
+    def get(self, data, default=None):
+        try: return self(data, default=default)
+        except (KeyError, IndexError, TypeError, ValueError): return default
+
+    @staticmethod
+    def traverse(data, keys, default=None):
+        for key in keys:
+            if isinstance(data, dict): data = data[str(key)]
+            elif isinstance(data, list): data = data[int(key)]
+            else: return default
+        return data
+
+    @staticmethod
+    def access(data, key, default=None):
+        try:
+            if isinstance(data, dict): return data.get(str(key), default)
+            elif isinstance(data, list): return data[int(key)]
+            else: return default
+        except (IndexError, ValueError): return default
+
+    @staticmethod
+    def expand(data):
+        if isinstance(data, dict): return list(data.values())
+        elif isinstance(data, list): return data
+        else: return []
+
+    @property
+    def locator(self): return self.__locator
+    @property
+    def fanout(self): return self.__fanout
+    @property
+    def keys(self): return self.__keys
 
 
 class WebDataMeta(AttributeMeta, TreeMeta, ABCMeta):
+    __registry__ = dict()
+
     def __init__(cls, *args, **kwargs):
         function = lambda name, base, locator: type(repr(cls) + str(name).title(), tuple([base]), dict(), locator=locator)
         modified = [function(key, cls.dependents[key], locator) for key, locator in kwargs.get("locators", {}).items()]
@@ -45,20 +156,40 @@ class WebDataMeta(AttributeMeta, TreeMeta, ABCMeta):
         cls.__optional__ = kwargs.get("optional", getattr(cls, "__optional__", False))
         cls.__multiple__ = kwargs.get("multiple", getattr(cls, "__multiple__", False))
         cls.__locator__ = kwargs.get("locator", getattr(cls, "__locator__", None))
+        cls.__bulk__ = kwargs.get("bulk", getattr(cls, "__bulk__", False))
+        cls.__compiled__ = cls.compile(cls.__locator__) if cls.__locator__ is not None else None
         cls.__attributes__ = attributes
+        cls.__address__ = f"{cls.__module__}:{cls.__qualname__}"
+        WebDataMeta.__registry__[cls.__address__] = cls
 
     def __call__(cls, sources, *args, **kwargs):
-        sources = list(cls.locate(sources, *args, **kwargs))
-        if not bool(sources) and not cls.optional: raise WebDataMissingError()
-        if len(sources) > 1 and not cls.multiple: raise WebDataMultipleError()
-        attributes = dict(children=cls.dependents) | dict(cls.attributes)
-        initialize = lambda source: super(WebDataMeta, cls).__call__(source, *args, **attributes, **kwargs)
+        with WebSnapshot.scope(), WebInstrument.measure("locate", datatype=cls.__name__):
+            sources = list(cls.locate(sources, *args, **kwargs))
+        if not bool(sources) and not cls.optional:
+            WebInstrument.count("missing", datatype=cls.__name__)
+            raise WebDataMissingError()
+        if len(sources) > 1 and not cls.multiple:
+            WebInstrument.count("multiple", datatype=cls.__name__)
+            raise WebDataMultipleError()
         if bool(cls.multiple) and not bool(sources): return list()
         elif not bool(sources): return lambda *arguments, **parameters: None
-        instances = list(map(initialize, sources))
+        instances = [cls.instantiate(source, *args, **kwargs) for source in sources]
+        cls.prepare(instances, *args, **kwargs)
         if bool(cls.multiple): return list(instances)
         else: return instances[0] if bool(instances) else None
 
+    @staticmethod
+    def resolve(address):
+        if address in WebDataMeta.__registry__: return WebDataMeta.__registry__[address]
+        module, name = str(address).split(":")
+        datatype = sys.modules["__main__"] if module == "__main__" else importlib.import_module(module)
+        for attribute in str(name).split("."): datatype = getattr(datatype, attribute)
+        return datatype
+
+    def instantiate(cls, source, *args, **kwargs):
+        attributes = dict(children=cls.dependents) | dict(cls.attributes)
+        return super(WebDataMeta, cls).__call__(source, *args, **attributes, **kwargs)
+
     @property
     def attributes(cls): return cls.__attributes__
     @property
@@ -67,6 +198,16 @@ class WebDataMeta(AttributeMeta, TreeMeta, ABCMeta):
     def multiple(cls): return cls.__multiple__
     @property
     def locator(cls): return cls.__locator__
+    @property
+    def compiled(cls): return cls.__compiled__
+    @property
+    def bulk(cls): return cls.__bulk__
+    @property
+    def address(cls): return cls.__address__
+    @property
+    def plan(cls):
+        if "__plan__" not in vars(cls): cls.__plan__ = WebDataPlan(cls)
+        return vars(cls)["__plan__"]
 
 
 class WebData(ABC, metaclass=WebDataMeta):
@@ -92,6 +233,11 @@ class WebData(ABC, metaclass=WebDataMeta):
     def parse(self, content, *args, **kwargs):
         return self.parser(content)
 
+    @classmethod
+    def compile(cls, locator): return locator
+    @classmethod
+    def prepare(cls, instances, *args, **kwargs): pass
+
     @property
     @abstractmethod
     def string(self): pass
@@ -116,35 +262,88 @@ class WebData(ABC, metaclass=WebDataMeta):
 class WebHTMLData(WebData, ABC):
     @classmethod
     def locate(cls, source, *args, **kwargs):
-        if isinstance(source, WebDriver): source = lxml.html.fromstring(source.page_source)
-        elif isinstance(source, WebElement): source = lxml.html.fromstring(source.get_attribute("innerHTML"))
-        contents = list(source.xpath(cls.locator))
+        if isinstance(source, (WebDriver, WebElement)):
+            snapshot = WebSnapshot.current()
+            source = snapshot(source) if snapshot is not None else WebSnapshot.parse(source)
+        contents = list(cls.compiled(source))
         yield from iter(contents)
 
+    @classmethod
+    def compile(cls, locator):
+        try: return lxml.etree.XPath(str(locator))
+        except lxml.etree.XPathSyntaxError as error: raise WebDataLocatorError(f"{cls.__name__}|{locator}") from error
+
+    @classmethod
+    def stream(cls, file, *args, **kwargs):
+        tag, selector = cls.terminal(cls.locator)
+        for event, element in lxml.etree.iterparse(file, events=("end",), tag=tag, html=True, recover=True):
+            if not bool(selector(element)): continue
+            content = cls.instantiate(element, *args, **kwargs)()
+            yield content
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None: del element.getparent()[0]
+
+    @staticmethod
+    def terminal(locator):
+        depth, index = 0, 0
+        for position, character in enumerate(str(locator)):
+            depth = depth + int(character == "[") - int(character == "]")
+            index = (position + 1) if (character == "/" and depth == 0) else index
+        step = re.sub(r"^[\w\-]+::", "", str(locator)[index:])
+        tag = re.match(r"[\w\-]+", step)
+        tag = tag.group(0) if tag is not None and tag.group(0) not in ("node", "text") else None
+        return tag, lxml.etree.XPath(f"self::{step}")
+
     @property
     def string(self): return lxml.html.tostring(self.html)
     @property
     def html(self): return self.source
 
 class WebJSONData(WebData, ABC):
+    __absent__ = object()
+
     @classmethod
     def locate(cls, source, *args, **kwargs):
         assert isinstance(source, (dict, list, tuple, str, Number))
-        if cls.locator is None: yield source
-        locators = str(cls.locator).lstrip("//").rstrip("[]").split("/")
-        try: contents = cls.retrieve(source, locators, default=None)
+        if cls.compiled is None:
+            yield source
+            return
+        try: contents = cls.compiled(source, default=cls.__absent__)
         except (KeyError, IndexError, TypeError): return
+        if contents is cls.__absent__: return
+        if bool(cls.compiled.fanout): contents = [content for content in contents if content is not cls.__absent__]
+        if bool(cls.compiled.fanout) and not bool(contents): return
         if bool(cls.multiple) and not isinstance(contents, list): contents = list([contents])
         if not bool(cls.multiple) and isinstance(contents, list): contents = tuple(contents)
         if not isinstance(contents, list): yield contents
         else: yield from iter(contents)
 
     @classmethod
-    def retrieve(cls, data, keys, default=None):
-        if not keys: return data
-        if isinstance(data, dict): return cls.retrieve(data[str(keys[0])], keys[1:], default)
-        elif isinstance(data, list): return cls.retrieve(data[int(keys[0])], keys[1:], default)
-        else: return default
+    def extract_many(cls, records, *args, array=False, default=None, **kwargs):
+        function = (lambda record: cls.compiled.get(record, default=default)) if cls.compiled is not None else (lambda record: record)
+        contents = list(map(function, records))
+        if not bool(array): return contents
+        try: return np.asarray(contents)
+        except ValueError:
+            arrays = np.empty(len(contents), dtype=object)
+            for index, content in enumerate(contents): arrays[index] = content
+            return arrays
+
+    @classmethod
+    def stream(cls, file, *args, **kwargs):
+        import ijson
+        keys = list(cls.compiled.keys) if cls.compiled is not None else []
+        fanout = bool(cls.compiled.fanout) if cls.compiled is not None else False
+        if any([bool(re.fullmatch(r"-?\d+", str(key))) for key in keys]): raise WebDataLocatorError(f"{cls.__name__}|{cls.locator}")
+        keys = ["item" if key == "*" else str(key) for key in keys]
+        keys = keys + (["item"] if bool(cls.multiple) and not fanout else [])
+        for content in ijson.items(file, ".".join(keys), use_float=True):
+            yield cls.instantiate(content, *args, **kwargs)()
+
+    @classmethod
+    def retrieve(cls, data, keys, default=None): return WebJSONPath.traverse(data, keys, default=default)
+    @classmethod
+    def compile(cls, locator): return WebJSONPath(locator)
 
     @property
     def string(self): return json.dumps(self.json, sort_keys=True, indent=3, separators=(',', ' : '), default=str)
@@ -152,6 +351,16 @@ class WebJSONData(WebData, ABC):
     def json(self): return self.source
 
 class WebELMTData(WebData, ABC):
+    __field__ = "innerHTML"
+
+    @classmethod
+    def bulkable(cls):
+        fields = [base for base in cls.__mro__ if "__field__" in vars(base)]
+        contents = [base for base in cls.__mro__ if "content" in vars(base)]
+        parsers = [base for base in cls.__mro__ if "parse" in vars(base)]
+        if not issubclass(cls, WebChild) or not bool(fields) or not bool(contents): return False
+        return fields[0] is contents[0] and parsers[0] is WebData
+
     @classmethod
     def locate(cls, source, *args, timeout, **kwargs):
         assert isinstance(source, (WebElement, WebDriver))
@@ -177,22 +386,166 @@ class WebELMTData(WebData, ABC):
 
 class WebParent(WebData, ABC):
     def execute(self, *args, **kwargs):
-        content = {key: value(*args, **kwargs) for key, value in iter(self)}
-        return self.parse(content, *args, **kwargs)
+        with WebSnapshot.scope(), WebInstrument.measure("execute", datatype=type(self).__name__):
+            content = {key: value(*args, **kwargs) for key, value in iter(self)}
+            return self.parse(content, *args, **kwargs)
 
 class WebChild(WebData, ABC):
     def execute(self, *args, **kwargs):
-        content = self.content
-        return self.parse(content, *args, **kwargs)
+        with WebInstrument.measure("execute", datatype=type(self).__name__):
+            content = self.content
+            return self.parse(content, *args, **kwargs)
 
     @property
     @abstractmethod
     def content(self): pass
 
 
+class WebDataNode(object):
+    __slots__ = ("source", "arguments", "parameters")
+    def __init__(self, source, arguments, parameters):
+        self.parameters = parameters
+        self.arguments = arguments
+        self.source = source
+
+    @classmethod
+    def create(cls, datatype):
+        reserved = set(cls.__slots__) | {"children", "parser", "create"}
+        members = (property, classmethod, staticmethod, FunctionType)
+        attributes = {name: value for base in reversed(datatype.__mro__) for name, value in vars(base).items() if isinstance(value, members)}
+        attributes = {name: value for name, value in attributes.items() if name not in reserved and not name.startswith("__")}
+        return type(f"{datatype.__name__}Node", tuple([cls]), attributes | dict(__slots__=()))
+
+
+class WebDataStep(object):
+    __slots__ = ("datatype", "key", "parser", "multiple", "optional", "native", "leaf", "node", "children")
+    def __init__(self, datatype, key):
+        prepare = getattr(datatype.prepare, "__func__", None) is WebData.prepare.__func__ or not bool(datatype.bulk)
+        execute = datatype.execute in (WebParent.execute, WebChild.execute)
+        self.native = bool(prepare and execute and datatype.parse is WebData.parse)
+        self.leaf = issubclass(datatype, WebChild)
+        self.parser = datatype.attributes["parser"]
+        self.multiple = bool(datatype.multiple)
+        self.optional = bool(datatype.optional)
+        self.datatype = datatype
+        self.key = key
+        self.node = WebDataNode.create(datatype) if self.leaf and self.native else None
+        self.children = tuple()
+
+
+class WebDataPlan(object):
+    def __len__(self): return len(self.steps)
+    def __repr__(self): return f"{type(self).__name__}({self.datatype.__name__}, steps={len(self)})"
+    def __init__(self, datatype, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__datatype = datatype
+        self.__steps = list()
+        self.compile(datatype, None)
+
+    def __call__(self, source, *args, **kwargs):
+        with WebSnapshot.scope(), WebInstrument.measure("plan", datatype=self.datatype.__name__):
+            return self.execute(0, source, args, kwargs)
+
+    def single(self, source, *args, **kwargs):
+        step = self.steps[0]
+        if not bool(step.native): return self.datatype.instantiate(source, *args, **kwargs)()
+        with WebSnapshot.scope(): return self.extract(step, source, args, kwargs)
+
+    def compile(self, datatype, key):
+        index, step = len(self.steps), WebDataStep(datatype, key)
+        self.steps.append(step)
+        if bool(step.native) and not bool(step.leaf):
+            step.children = tuple([self.compile(child, name) for name, child in datatype.dependents.items()])
+        return index
+
+    def execute(self, index, source, arguments, parameters):
+        step = self.steps[index]
+        if not bool(step.native):
+            located = step.datatype(source, *arguments, **parameters)
+            return [instance() for instance in located] if isinstance(located, list) else located()
+        sources = list(step.datatype.locate(source, *arguments, **parameters))
+        if not bool(sources) and not step.optional:
+            WebInstrument.count("missing", datatype=step.datatype.__name__)
+            raise WebDataMissingError()
+        if len(sources) > 1 and not step.multiple:
+            WebInstrument.count("multiple", datatype=step.datatype.__name__)
+            raise WebDataMultipleError()
+        if not bool(sources): return list() if step.multiple else None
+        contents = [self.extract(step, content, arguments, parameters) for content in sources]
+        return contents if step.multiple else contents[0]
+
+    def extract(self, step, source, arguments, parameters):
+        if bool(step.leaf): return step.parser(step.node(source, arguments, parameters).content)
+        contents = {self.steps[index].key: self.execute(index, source, arguments, parameters) for index in step.children}
+        return step.parser(contents)
+
+    @property
+    def datatype(self): return self.__datatype
+    @property
+    def steps(self): return self.__steps
+
+
 class WebHTML(WebParent, WebHTMLData, ABC, root=True): pass
 class WebJSON(WebParent, WebJSONData, ABC, root=True): pass
-class WebELMT(WebParent, WebELMTData, ABC, root=True): pass
+class WebELMT(WebParent, WebELMTData, ABC, root=True):
+    __script__ = """
+        var elements = arguments[0], specifications = arguments[1];
+        var attribute = function(element, field) {
+            var value = element[field];
+            if (value === undefined || value === null) value = element.getAttribute(field);
+            return (value === undefined || value === null) ? null : String(value);
+        };
+        return elements.map(function(element) {
+            var results = {};
+            specifications.forEach(function(specification) {
+                var located = document.evaluate(specification[1], element, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var values = [];
+                for (var index = 0; index < located.snapshotLength; index++) values.push(attribute(located.snapshotItem(index), specification[2]));
+                results[specification[0]] = values;
+            });
+            return results;
+        });
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__prefetched = None
+
+    def __iter__(self):
+        if self.prefetched is None: yield from super().__iter__()
+        else:
+            for key, child in self.children.items():
+                if key not in self.prefetched: yield key, child(self.source, *self.arguments, **self.parameters)
+                else: yield key, self.extract(child, self.prefetched[key])
+
+    @classmethod
+    def prepare(cls, instances, *args, **kwargs):
+        if not bool(cls.bulk) or not bool(instances): return
+        children = {key: child for key, child in cls.dependents.items() if child.locator is not None and child.bulkable()}
+        if not bool(children): return
+        specifications = [[str(key), str(child.locator), str(child.__field__)] for key, child in children.items()]
+        elements = [instance.element for instance in instances]
+        driver = elements[0] if isinstance(elements[0], WebDriver) else elements[0].parent
+        results = driver.execute_script(cls.__script__, elements, specifications)
+        for instance, result in zip(instances, results): instance.prefetched = {key: list(result[str(key)]) for key in children.keys()}
+
+    @staticmethod
+    def extract(child, contents):
+        if not bool(contents) and not child.optional:
+            WebInstrument.count("missing", datatype=child.__name__)
+            raise WebDataMissingError()
+        if len(contents) > 1 and not child.multiple:
+            WebInstrument.count("multiple", datatype=child.__name__)
+            raise WebDataMultipleError()
+        parser = child.attributes["parser"]
+        if bool(child.multiple): contents = [parser(content) for content in contents]
+        else: contents = parser(contents[0]) if bool(contents) else None
+        return lambda *arguments, **parameters: contents
+
+    @property
+    def prefetched(self): return self.__prefetched
+    @prefetched.setter
+    def prefetched(self, prefetched): self.__prefetched = prefetched
 
 
 class WebHTMLText(WebChild, WebHTML, ABC, attribute="Text"):
@@ -209,10 +562,79 @@ class WebHTMLLink(WebChild, WebHTML, ABC, attribute="Link"):
 
 class WebHTMLTable(WebChild, WebHTML, ABC, attribute="Table"):
     @property
-    def table(self): return pd.concat(pd.read_html(self.string, header=0, index_col=None), axis=0)
+    def table(self): return self.combine([self.html])
     @property
     def content(self): return self.table
 
+    @classmethod
+    def combine(cls, elements, thousands=","):
+        elements = [element.html if isinstance(element, WebHTMLData) else element for element in elements]
+        grids = [cls.grid(table) for element in elements for table in element.xpath("descendant-or-self::table")]
+        if not bool(grids): return pd.DataFrame()
+        headers = set([tuple(map(tuple, header)) for header, rows in grids])
+        if len(headers) == 1: return cls.frame(grids[0][0], [rows for header, rows in grids], thousands=thousands)
+        return pd.concat([cls.frame(header, [rows], thousands=thousands) for header, rows in grids], axis=0)
+
+    @classmethod
+    def grid(cls, table):
+        rows = cls.expand(table.xpath("./thead/tr | ./tbody/tr | ./tr | ./tfoot/tr"))
+        heading = len(table.xpath("./thead/tr"))
+        if not bool(heading): heading = next((index for index, row in enumerate(rows) if not all([cell.tag == "th" for cell in row.cells])), len(rows))
+        heading = max(heading, 1) if bool(rows) else 0
+        header = [[value for value in row.values] for row in rows[:heading]]
+        return header, [row.values for row in rows[heading:]]
+
+    @classmethod
+    def expand(cls, rows):
+        pending, results = dict(), list()
+        for row in rows:
+            cells, values, column = list(row.xpath("./td | ./th")), list(), 0
+            for cell in cells:
+                while column in pending: values, column = values + [cls.pending(pending, column)], column + 1
+                text = cell.text_content().strip()
+                text = text if bool(text) else np.nan
+                for _ in range(cls.span(cell, "colspan")):
+                    if cls.span(cell, "rowspan") > 1: pending[column] = [cls.span(cell, "rowspan") - 1, text]
+                    values, column = values + [text], column + 1
+            for index in sorted([index for index in pending.keys() if index >= column]):
+                values = values + [np.nan] * (index - len(values))
+                values = values + [cls.pending(pending, index)]
+            results.append(SimpleNamespace(cells=cells, values=values))
+        return results
+
+    @staticmethod
+    def pending(pending, column):
+        remaining, value = pending[column]
+        if remaining > 1: pending[column] = [remaining - 1, value]
+        else: del pending[column]
+        return value
+
+    @staticmethod
+    def span(cell, attribute):
+        try: return max(int(cell.get(attribute, 1)), 1)
+        except (TypeError, ValueError): return 1
+
+    @staticmethod
+    def frame(header, blocks, thousands=","):
+        width = max([len(values) for rows in blocks for values in rows] + [len(values) for values in header] + [0])
+        length = sum([len(rows) for rows in blocks])
+        contents = np.full((length, width), np.nan, dtype=object)
+        position = 0
+        for rows in blocks:
+            for values in rows:
+                contents[position, :len(values)] = values
+                position = position + 1
+        header = [list(values) + [np.nan] * (width - len(values)) for values in header]
+        columns = [tuple(values[index] if not pd.isna(values[index]) else f"Unnamed: {index}" for values in header) for index in range(width)]
+        columns = [column[0] if len(column) == 1 else column for column in columns] if bool(header) else list(range(width))
+        columns = [column if column not in columns[:index] else f"{column}.{columns[:index].count(column)}" for index, column in enumerate(columns)] if len(header) == 1 else columns
+        columns = pd.MultiIndex.from_tuples(columns) if len(header) > 1 else pd.Index(columns)
+        series = [pd.Series(contents[:, index], dtype=object) for index in range(width)]
+        strip = lambda value: value.replace(thousands, "") if isinstance(value, str) and bool(thousands) else value
+        numerics = [pd.to_numeric(values.map(strip), errors="coerce") for values in series]
+        series = [numeric if int(numeric.notna().sum()) == int(values.notna().sum()) else values for values, numeric in zip(series, numerics)]
+        return pd.DataFrame(dict(enumerate(series))).set_axis(columns, axis=1)
+
 
 class WebJsonCollection(WebChild, WebJSON, ABC, attribute="Collection"):
     @property
@@ -234,18 +656,24 @@ class WebJsonText(WebChild, WebJSON, ABC, attribute="Text"):
 
 
 class WebELMTText(WebChild, WebELMT, ABC, attribute="Text"):
+    __field__ = "text"
+
     @property
     def text(self): return self.element.get_attribute("text")
     @property
     def content(self): return self.text
 
 class WebELMTValue(WebChild, WebELMT, ABC, attribute="Value"):
+    __field__ = "value"
+
     @property
     def value(self): return self.element.get_attribute("value")
     @property
     def content(self): return self.value
 
 class WebELMTLink(WebChild, WebELMT, ABC, attribute="Link"):
+    __field__ = "href"
+
     @property
     def link(self): return self.element.get_attribute("href")
     @property
@@ -273,8 +701,14 @@ class WebELMTDropdown(WebELMTClickable, ABC, attribute="Dropdown", dependents=[W
 
     @property
     def menu(self):
-        function = lambda instance: instance(*self.arguments, **self.parameters)
-        keys, values = list(map(function, self["menu"])), list(self["menu"])
+        values = list(self["menu"])
+        if not bool(values): return ODict()
+        elements = [value.element for value in values]
+        driver = elements[0] if isinstance(elements[0], WebDriver) else elements[0].parent
+        specifications = [["menu", ".", str(type(values[0]).__field__)]]
+        results = driver.execute_script(self.__script__, elements, specifications)
+        parser = type(values[0]).attributes["parser"]
+        keys = [parser(result["menu"][0]) if bool(result["menu"]) else None for result in results]
         return ODict(list(zip(keys, values)))
 
 
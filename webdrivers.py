@@ -6,66 +6,251 @@ Created on Mon Dec 30 2019
 
 """
 
+import re
+import json
+import queue
+import base64
+import threading
 import lxml.html
 import selenium.webdriver
+from types import SimpleNamespace
+from dataclasses import dataclass
+from collections import deque
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service as ChromeService
 
 from webscraping.websources import WebSource, WebDelayer
+from webscraping.webinstruments import WebInstrument
+from webscraping.webdatas import WebSnapshot
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebDriver"]
+__all__ = ["WebDriver", "WebDriverProfile", "WebDriverCapture", "WebDriverPool", "WebDriverLease"]
 __copyright__ = "Copyright 2026, Jack Kirby Cook"
 __license__ = "MIT License"
 
 
+@dataclass(frozen=True)
+class WebDriverProfile:
+    headless: bool = False; strategy: str = "normal"; resources: tuple = (); blocked: tuple = ()
+
+    def __post_init__(self):
+        assert self.strategy in ("normal", "eager", "none")
+        assert all([resource in self.extensions.keys() for resource in self.resources])
+
+    @classmethod
+    def lean(cls, blocked=()):
+        return cls(headless=True, strategy="eager", resources=("image", "font", "media"), blocked=tuple(blocked))
+
+    @property
+    def extensions(self):
+        image = ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp", "avif")
+        font = ("woff", "woff2", "ttf", "otf", "eot")
+        media = ("mp4", "webm", "mp3", "ogg", "wav", "m4a", "avi", "mov")
+        stylesheet = ("css",)
+        return dict(image=image, font=font, media=media, stylesheet=stylesheet)
+
+    @property
+    def patterns(self):
+        extensions = [extension for resource in self.resources for extension in self.extensions[resource]]
+        return [f"*.{extension}" for extension in extensions] + list(self.blocked)
+
+
+class WebDriverCapture(object):
+    def __len__(self): return len(self.responses)
+    def __init__(self, *args, size=100, urls=(), types=("application/json",), kinds=("XHR", "Fetch"), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__urls = [re.compile(str(url)) for url in urls]
+        self.__responses = deque(maxlen=int(size))
+        self.__requests = deque(maxlen=int(size))
+        self.__types = tuple(types)
+        self.__kinds = tuple(kinds)
+
+    def reset(self, driver):
+        driver.get_log("performance")
+        self.responses.clear()
+        self.requests.clear()
+
+    def drain(self, driver):
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, parameters = message.get("method", None), message.get("params", {})
+            if method == "Network.requestWillBeSent": self.request(parameters)
+            elif method == "Network.responseReceived": self.response(parameters)
+
+    def request(self, parameters):
+        request, kind = parameters["request"], parameters.get("type", None)
+        if not self.matches(request["url"]) or (bool(self.kinds) and kind not in self.kinds): return
+        contents = dict(url=request["url"], method=request.get("method", None), headers=dict(request.get("headers", {})), body=request.get("postData", None))
+        self.requests.append(SimpleNamespace(identity=parameters["requestId"], kind=kind, **contents))
+
+    def response(self, parameters):
+        response, kind = parameters["response"], parameters.get("type", None)
+        mimetype = str(response.get("mimeType", ""))
+        if not self.matches(response["url"]) or (bool(self.kinds) and kind not in self.kinds): return
+        if bool(self.types) and not any([str(content) in mimetype for content in self.types]): return
+        contents = dict(url=response["url"], status=int(response.get("status", 0)), headers=dict(response.get("headers", {})), mimetype=mimetype)
+        self.responses.append(SimpleNamespace(identity=parameters["requestId"], kind=kind, **contents))
+
+    def matches(self, url): return not bool(self.urls) or any([bool(pattern.search(str(url))) for pattern in self.urls])
+    def find(self, pattern=None):
+        pattern = re.compile(str(pattern)) if pattern is not None else None
+        for response in reversed(self.responses):
+            if pattern is None or bool(pattern.search(response.url)): return response
+        return None
+
+    @property
+    def responses(self): return self.__responses
+    @property
+    def requests(self): return self.__requests
+    @property
+    def urls(self): return self.__urls
+    @property
+    def types(self): return self.__types
+    @property
+    def kinds(self): return self.__kinds
+
+
 class WebDriver(WebSource):
-    def __init__(self, *args, executable, timeout=60, **kwargs):
+    def __init__(self, *args, executable, timeout=60, profile=None, capture=None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.__capture = WebDriverCapture(**capture) if isinstance(capture, dict) else capture
+        self.__profile = profile if profile is not None else WebDriverProfile()
         self.__executable = executable
         self.__timeout = int(timeout)
+        self.__location = None
+        self.__document = None
+        self.__baseline = None
+        self.__loads = 0
+        self.__page = None
 
     def start(self):
+        if self.cassette is not None: self.cassette.open()
+        if self.replaying: return
         executable = self.executable
         options = selenium.webdriver.ChromeOptions()
-        self.setup(options)
+        self.setup(options, profile=self.profile, capture=self.capture)
         service = ChromeService(executable)
         driver = selenium.webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(self.timeout)
+        driver.execute_cdp_cmd("Performance.enable", {})
+        if bool(self.profile.patterns) or self.capture is not None: driver.execute_cdp_cmd("Network.enable", {})
+        if bool(self.profile.patterns): driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.profile.patterns})
         self.driver = driver
+        self.baseline = self.memory
+        self.loads = 0
 
     def stop(self):
-        self.driver.quit()
+        if self.driver is not None: self.driver.quit()
+        if self.cassette is not None: self.cassette.close()
         self.driver = None
+        self.invalidate()
 
-    @WebDelayer.register
     def load(self, url, *args, **kwargs):
-        self.driver.get(str(url))
+        if self.replaying: self.replay(url, *args, **kwargs)
+        else: self.fetch(url, *args, **kwargs)
+
+    @WebDelayer.register
+    def fetch(self, url, *args, wait=(), **kwargs):
+        self.invalidate()
+        if self.capture is not None: self.capture.reset(self.driver)
+        with WebInstrument.measure("fetch", domain=WebDelayer.domain(url), source="driver"): self.driver.get(str(url))
+        self.loads = self.loads + 1
+        locators = [str(getattr(locator, "locator", locator)) for locator in wait]
+        located = lambda driver: all([bool(driver.find_elements(By.XPATH, locator)) for locator in locators])
+        if bool(locators):
+            try: WebDriverWait(self.driver, self.timeout).until(located)
+            except TimeoutException: pass
+        if self.capture is not None: self.capture.drain(self.driver)
+        if self.recording:
+            response = SimpleNamespace(content=self.text.encode("utf-8"), url=self.driver.current_url, status=200, headers={}, encoding="utf-8")
+            self.cassette.record(url, response)
+
+    def replay(self, url, *args, **kwargs):
+        self.invalidate()
+        response = self.cassette.replay(url)
+        self.location = response.url
+        self.page = response.text
+        self.loads = self.loads + 1
+
+    def reset(self):
+        handles = list(self.driver.window_handles)
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (error) {}")
+        self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.driver.delete_all_cookies()
+        self.driver.get("about:blank")
+        if self.capture is not None: self.capture.reset(self.driver)
+        self.invalidate()
 
     def navigate(self, value):
         if isinstance(value, int): handle = list(self.driver.window_handles)[value]
         elif isinstance(value, str): handle = self.windows[value]
         else: raise TypeError(type(value))
+        self.invalidate()
         self.driver.switch_to.window(handle)
 
+    def invalidate(self):
+        snapshot = WebSnapshot.current()
+        if snapshot is not None and self.driver is not None: snapshot.documents.pop(WebSnapshot.identify(self.driver), None)
+        self.document = None
+        self.page = None
+
+    def intercept(self, pattern=None):
+        if self.capture is None: return None
+        self.capture.drain(self.driver)
+        response = self.capture.find(pattern)
+        if response is None: return None
+        try: content = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": response.identity})
+        except WebDriverException: return None
+        content = base64.b64decode(content["body"]) if bool(content.get("base64Encoded", False)) else content["body"]
+        return json.loads(content) if "json" in response.mimetype else content
+
     @WebDelayer.register
-    def refresh(self): self.driver.refresh()
+    def refresh(self):
+        self.invalidate()
+        self.driver.refresh()
+
     @WebDelayer.register
-    def forward(self): self.driver.foward()
+    def forward(self):
+        self.invalidate()
+        self.driver.forward()
+
     @WebDelayer.register
-    def back(self): self.driver.back()
+    def back(self):
+        self.invalidate()
+        self.driver.back()
+
+    def pageup(self): self.keys(Keys.PAGE_UP)
+    def pagedown(self): self.keys(Keys.PAGE_DOWN)
+    def pagehome(self): self.keys(Keys.HOME)
+    def pageend(self): self.keys(Keys.END)
+    def keys(self, keys):
+        self.invalidate()
+        self.driver.find_element(By.TAG_NAME, "html").send_keys(keys)
+
+    def maximize(self):
+        self.invalidate()
+        self.driver.maximize_window()
 
-    def pageup(self): self.driver.find_element(By.TAG_NAME, "html").send_keys(Keys.PAGE_UP)
-    def pagedown(self): self.driver.find_element(By.TAG_NAME, "html").send_keys(Keys.PAGE_DOWN)
-    def pagehome(self): self.driver.find_element(By.TAG_NAME, "html").send_keys(Keys.HOME)
-    def pageend(self): self.driver.find_element(By.TAG_NAME, "html").send_keys(Keys.END)
-    def maximize(self): self.driver.maximize_window()
-    def minimize(self): self.driver.minimize_window()
+    def minimize(self):
+        self.invalidate()
+        self.driver.minimize_window()
 
     @staticmethod
-    def setup(options, *args, **kwargs):
+    def setup(options, *args, profile=None, capture=None, **kwargs):
+        profile = profile if profile is not None else WebDriverProfile()
+        if capture is not None: options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.page_load_strategy = str(profile.strategy)
+        if bool(profile.headless): options.add_argument("--headless=new")
+        if "image" in profile.resources: options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_argument("log-level=3")
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-popup-blocking")
@@ -85,15 +270,32 @@ class WebDriver(WebSource):
         self.driver.switch_to.window(current)
 
     @property
-    def response(self): return [request.response for request in self.driver.requests]
+    def response(self): return list(self.capture.responses) if self.capture is not None else []
     @property
-    def request(self): return [request for request in self.driver.requests]
+    def request(self): return list(self.capture.requests) if self.capture is not None else []
     @property
-    def html(self): return lxml.html.fromstring(self.driver.page_source)
+    def html(self):
+        if self.driver is None:
+            if self.document is None: self.document = lxml.html.fromstring(self.text)
+            return self.document
+        snapshot = WebSnapshot.current()
+        if snapshot is not None: return snapshot(self.driver)
+        with WebInstrument.measure("parse", source="driver") as measure:
+            text = self.text
+            measure(bytes=len(text))
+            return lxml.html.fromstring(text)
+
+    @property
+    def text(self): return self.driver.page_source if self.driver is not None else self.page
+
     @property
-    def text(self): return self.driver.page_source
+    def memory(self):
+        metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        metrics = {metric["name"]: metric["value"] for metric in metrics}
+        return int(metrics.get("JSHeapTotalSize", 0))
+
     @property
-    def url(self): return self.driver.current_url
+    def url(self): return self.driver.current_url if self.driver is not None else self.location
     @property
     def elmt(self): return self.driver
     @property
@@ -104,12 +306,137 @@ class WebDriver(WebSource):
     @driver.setter
     def driver(self, driver): self.source = driver
 
+    @property
+    def document(self): return self.__document
+    @document.setter
+    def document(self, document): self.__document = document
+    @property
+    def page(self): return self.__page
+    @page.setter
+    def page(self, page): self.__page = page
+
+    @property
+    def location(self): return self.__location
+    @location.setter
+    def location(self, location): self.__location = location
+    @property
+    def baseline(self): return self.__baseline
+    @baseline.setter
+    def baseline(self, baseline): self.__baseline = baseline
+    @property
+    def loads(self): return self.__loads
+    @loads.setter
+    def loads(self, loads): self.__loads = loads
+
+    @property
+    def capture(self): return self.__capture
+    @property
+    def profile(self): return self.__profile
     @property
     def executable(self): return self.__executable
     @property
     def timeout(self): return self.__timeout
 
 
+class WebDriverLease(object):
+    def __bool__(self): return self.driver is not None
+    def __init__(self, pool):
+        self.__pool = pool
+        self.__driver = None
+
+    def __enter__(self): return self.acquire()
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.release()
+
+    def __getattr__(self, attribute):
+        if attribute.startswith("_") or self.driver is None: raise AttributeError(attribute)
+        return getattr(self.driver, attribute)
+
+    def acquire(self):
+        if self.driver is None: self.driver = self.pool.acquire()
+        return self.driver
+
+    def release(self):
+        if self.driver is not None: self.pool.release(self.driver)
+        self.driver = None
+
+    @property
+    def pool(self): return self.__pool
+    @property
+    def driver(self): return self.__driver
+    @driver.setter
+    def driver(self, driver): self.__driver = driver
+
 
+class WebDriverPool(object):
+    def __init__(self, *args, size=1, loads=None, memory=None, wait=None, **parameters):
+        self.__loads = int(loads) if loads is not None else None
+        self.__memory = int(memory) if memory is not None else None
+        self.__wait = float(wait) if wait is not None else None
+        self.__parameters = dict(parameters)
+        self.__size = int(size)
+        self.__mutex = threading.Lock()
+        self.__queue = queue.Queue()
+        self.__drivers = list()
 
+    def __enter__(self):
+        self.start()
+        return self
 
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.stop()
+
+    def start(self):
+        for _ in range(self.size): self.queue.put(self.create())
+
+    def stop(self):
+        while not self.queue.empty(): self.queue.get_nowait()
+        with self.mutex: drivers, self.drivers[:] = list(self.drivers), []
+        for driver in drivers: driver.stop()
+
+    def lease(self): return WebDriverLease(self)
+    def acquire(self):
+        try: return self.queue.get(timeout=self.wait)
+        except queue.Empty: raise TimeoutError(f"WebDriverPool|{str(self.size)}")
+
+    def release(self, driver):
+        try:
+            if self.expired(driver): driver = self.recycle(driver)
+            else: driver.reset()
+        except WebDriverException: driver = self.recycle(driver)
+        self.queue.put(driver)
+
+    def expired(self, driver):
+        loads = self.loads is not None and driver.loads >= self.loads
+        memory = self.memory is not None and driver.memory - driver.baseline >= self.memory
+        return bool(loads or memory)
+
+    def recycle(self, driver):
+        with self.mutex:
+            if driver in self.drivers: self.drivers.remove(driver)
+        try: driver.stop()
+        except WebDriverException: pass
+        return self.create()
+
+    def create(self):
+        driver = WebDriver(**self.parameters)
+        driver.start()
+        with self.mutex: self.drivers.append(driver)
+        return driver
+
+    @property
+    def parameters(self): return self.__parameters
+    @property
+    def drivers(self): return self.__drivers
+    @property
+    def queue(self): return self.__queue
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def size(self): return self.__size
+    @property
+    def loads(self): return self.__loads
+    @property
+    def memory(self): return self.__memory
+    @property
+    def wait(self): return self.__wait
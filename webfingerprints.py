@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebFingerprint Objects
+@author: Jack Kirby Cook
+
+"""
+
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+import lxml.etree
+from dataclasses import dataclass, field
+
+from webscraping.webcaches import WebCache
+from webscraping.webdatas import WebJSONData, WebDataMissingError
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebFingerprints", "WebDelta"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+@dataclass(frozen=True)
+class WebDelta:
+    url: str; changed: bool; values: object
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+
+    def __bool__(self): return bool(self.changed)
+
+
+class WebFingerprints(object):
+    __schema__ = "CREATE TABLE IF NOT EXISTS fingerprints (key TEXT PRIMARY KEY, url TEXT, digest TEXT, contents BLOB, subtrees BLOB, stored REAL)"
+
+    def __init__(self, *args, file=":memory:", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__counters = dict(unchanged=0, changed=0, reused=0, extracted=0)
+        self.__mutex = threading.Lock()
+        self.__connection = None
+        self.__file = str(file)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.close()
+
+    def __call__(self, url, response, datatype, *args, payload=None, subtrees=False, **kwargs):
+        key = f"{datatype.address}|{WebCache.fingerprint(url, payload=payload)}"
+        digest, entry = self.digest(response.content), self.get(key)
+        if entry is not None and entry["digest"] == digest:
+            with self.mutex: self.counters["unchanged"] = self.counters["unchanged"] + 1
+            return WebDelta(str(url), False, entry["values"])
+        with self.mutex: self.counters["changed"] = self.counters["changed"] + 1
+        document = response.json if issubclass(datatype, WebJSONData) else response.html
+        if bool(subtrees) and bool(datatype.multiple): delta, hashed = self.subtrees(url, document, datatype, entry, *args, **kwargs)
+        else: delta, hashed = self.page(url, document, datatype, entry, *args, **kwargs)
+        self.put(key, url, digest, delta.values, hashed)
+        return delta
+
+    def page(self, url, document, datatype, entry, *args, **kwargs):
+        values = datatype.plan(document, *args, **kwargs)
+        previous = entry["values"] if entry is not None else None
+        with self.mutex: self.counters["extracted"] = self.counters["extracted"] + 1
+        changed = values != previous
+        added, removed = [values] if changed else [], [previous] if changed and previous is not None else []
+        delta = WebDelta(str(url), changed, values, added=added, removed=removed)
+        return delta, {}
+
+    def subtrees(self, url, document, datatype, entry, *args, **kwargs):
+        sources = list(datatype.locate(document, *args, **kwargs))
+        if not bool(sources) and not datatype.optional: raise WebDataMissingError()
+        cached, current, values = dict(entry["subtrees"]) if entry is not None else dict(), dict(), list()
+        for source in sources:
+            digest = self.digest(source)
+            if digest in cached: value, counter = cached[digest], "reused"
+            elif digest in current: value, counter = current[digest], "reused"
+            else: value, counter = datatype.plan.single(source, *args, **kwargs), "extracted"
+            with self.mutex: self.counters[counter] = self.counters[counter] + 1
+            current[digest] = value
+            values.append(value)
+        added = [value for digest, value in current.items() if digest not in cached]
+        removed = [value for digest, value in cached.items() if digest not in current]
+        delta = WebDelta(str(url), bool(added) or bool(removed), values, added=added, removed=removed)
+        return delta, current
+
+    def open(self):
+        if self.connection is not None: return
+        connection = sqlite3.connect(self.file, check_same_thread=False)
+        connection.execute(self.__schema__)
+        connection.commit()
+        self.connection = connection
+
+    def close(self):
+        if self.connection is not None: self.connection.close()
+        self.connection = None
+
+    def get(self, key):
+        self.open()
+        with self.mutex:
+            cursor = self.connection.execute("SELECT digest, contents, subtrees FROM fingerprints WHERE key = ?", (key,))
+            entry = cursor.fetchone()
+        if entry is None: return None
+        digest, values, subtrees = entry
+        return dict(digest=digest, values=pickle.loads(values), subtrees=pickle.loads(subtrees))
+
+    def put(self, key, url, digest, values, subtrees):
+        self.open()
+        contents = (key, str(url), digest, pickle.dumps(values), pickle.dumps(dict(subtrees)), time.time())
+        with self.mutex:
+            self.connection.execute("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)", contents)
+            self.connection.commit()
+
+    @staticmethod
+    def digest(content):
+        if isinstance(content, lxml.etree._Element): content = lxml.etree.tostring(content, with_tail=False)
+        elif not isinstance(content, (bytes, bytearray, memoryview, str)): content = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        content = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    @property
+    def connection(self): return self.__connection
+    @connection.setter
+    def connection(self, connection): self.__connection = connection
+    @property
+    def counters(self): return self.__counters
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def file(self): return self.__file
+
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebFrontier Objects
+@author: Jack Kirby Cook
+
+"""
+
+import math
+import heapq
+import hashlib
+import threading
+from itertools import count
+from collections import deque
+
+from webscraping.websources import WebDelayer
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebFrontier", "WebBloom"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebBloom(object):
+    def __init__(self, *args, capacity, error=0.001, **kwargs):
+        super().__init__(*args, **kwargs)
+        size = math.ceil(- int(capacity) * math.log(float(error)) / (math.log(2) ** 2))
+        self.__hashes = max(round(size / int(capacity) * math.log(2)), 1)
+        self.__bits = bytearray((size + 7) // 8)
+        self.__size = int(size)
+
+    def __contains__(self, key): return all([self.bits[index >> 3] & (1 << (index & 7)) for index in self.indexes(key)])
+    def add(self, key):
+        for index in self.indexes(key): self.bits[index >> 3] |= 1 << (index & 7)
+
+    def indexes(self, key):
+        digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    @property
+    def hashes(self): return self.__hashes
+    @property
+    def bits(self): return self.__bits
+    @property
+    def size(self): return self.__size
+
+
+class WebFrontier(object):
+    def __bool__(self): return bool(len(self))
+    def __len__(self): return sum([len(entries) for entries in self.queues.values()])
+    def __init__(self, *args, delayer=None, bloom=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__seen = WebBloom(capacity=int(bloom)) if bloom is not None else set()
+        self.__condition = threading.Condition()
+        self.__delayer = delayer
+        self.__domains = deque()
+        self.__queues = dict()
+        self.__counter = count()
+        self.__closed = False
+
+    def __iter__(self):
+        while True:
+            url = self.pop()
+            if url is None: return
+            yield url
+
+    def push(self, url, *args, priority=0, **kwargs):
+        key, domain = url, WebDelayer.domain(url)
+        with self.condition:
+            if self.closed or key in self.seen: return False
+            self.seen.add(key)
+            if domain not in self.queues:
+                self.queues[domain] = list()
+                self.domains.append(domain)
+            heapq.heappush(self.queues[domain], (priority, next(self.counter), url))
+            self.condition.notify()
+        return True
+
+    def extend(self, urls, *args, **kwargs):
+        return sum([int(self.push(url, *args, **kwargs)) for url in urls])
+
+    def pop(self, *args, timeout=None, **kwargs):
+        with self.condition:
+            while True:
+                delays = list()
+                for _ in range(len(self.domains)):
+                    domain = self.domains[0]
+                    self.domains.rotate(-1)
+                    if not bool(self.queues[domain]): continue
+                    delay = self.delayer.ready(domain) if self.delayer is not None else 0
+                    if bool(delay):
+                        delays.append(delay)
+                        continue
+                    priority, counter, url = heapq.heappop(self.queues[domain])
+                    return url
+                if self.closed and not bool(delays): return None
+                if timeout is not None and timeout <= 0: return None
+                wait = min(delays + ([timeout] if timeout is not None else [])) if bool(delays) else timeout
+                self.condition.wait(wait)
+                timeout = None if timeout is None else timeout - (wait if wait is not None else 0)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    @property
+    def condition(self): return self.__condition
+    @property
+    def delayer(self): return self.__delayer
+    @property
+    def domains(self): return self.__domains
+    @property
+    def queues(self): return self.__queues
+    @property
+    def counter(self): return self.__counter
+    @property
+    def seen(self): return self.__seen
+    @property
+    def closed(self): return self.__closed
+    @closed.setter
+    def closed(self, closed): self.__closed = closed
+
+
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebInstrument Objects
+@author: Jack Kirby Cook
+
+"""
+
+import time
+import threading
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebInstrument", "WebRegistry"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebIdleMeasurement(object):
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, error_type, error_value, error_traceback): pass
+    def __call__(self, **values): pass
+
+
+class WebMeasurement(object):
+    __slots__ = ("instrument", "stage", "labels", "values", "start")
+    def __init__(self, instrument, stage, labels):
+        self.instrument = instrument
+        self.labels = labels
+        self.stage = stage
+        self.values = {}
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        seconds = time.perf_counter() - self.start
+        self.instrument.record(self.stage, seconds, self.labels, self.values)
+
+    def __call__(self, **values):
+        for key, value in values.items():
+            if key == "bytes": self.values[key] = value
+            else: self.labels[key] = value
+
+
+class WebRegistry(object):
+    def __init__(self, *args, prefix="webscraping", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__mutex = threading.Lock()
+        self.__prefix = str(prefix)
+        self.__counters = dict()
+        self.__timings = dict()
+
+    def __call__(self, event):
+        event = dict(event)
+        name, kind = event.pop("name"), event.pop("kind")
+        seconds, size = event.pop("seconds", None), event.pop("bytes", None)
+        labels = tuple(sorted([(str(key), str(value)) for key, value in event.items() if value is not None]))
+        with self.mutex:
+            if kind == "counter": self.counters[(name, labels)] = self.counters.get((name, labels), 0) + 1
+            if kind != "timing": return
+            count, total = self.timings.get((name, labels), (0, 0.0))
+            self.timings[(name, labels)] = (count + 1, total + float(seconds))
+            if size is not None: self.counters[("bytes", labels)] = self.counters.get(("bytes", labels), 0) + int(size)
+
+    def exposition(self):
+        label = lambda labels: ("{" + ",".join([f'{key}="{value}"' for key, value in labels]) + "}") if bool(labels) else ""
+        with self.mutex: counters, timings = dict(self.counters), dict(self.timings)
+        lines = [f"{self.prefix}_{name}_total{label(labels)} {value}" for (name, labels), value in sorted(counters.items())]
+        for (name, labels), (count, total) in sorted(timings.items()):
+            lines.append(f"{self.prefix}_{name}_seconds_count{label(labels)} {count}")
+            lines.append(f"{self.prefix}_{name}_seconds_sum{label(labels)} {total:.9f}")
+        return "\n".join(lines) + "\n"
+
+    @property
+    def counters(self): return self.__counters
+    @property
+    def timings(self): return self.__timings
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def prefix(self): return self.__prefix
+
+
+class WebInstrument(object):
+    __idle__ = WebIdleMeasurement()
+    __active__ = None
+
+    def __init__(self, *args, callbacks=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__callbacks = list(callbacks)
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.uninstall()
+
+    def install(self): WebInstrument.__active__ = self
+    def uninstall(self):
+        if WebInstrument.__active__ is self: WebInstrument.__active__ = None
+
+    def record(self, stage, seconds, labels, values):
+        event = dict(labels) | dict(values) | dict(name=stage, kind="timing", seconds=seconds)
+        for callback in self.callbacks: callback(event)
+
+    def increment(self, name, labels):
+        event = dict(labels) | dict(name=name, kind="counter")
+        for callback in self.callbacks: callback(event)
+
+    @staticmethod
+    def measure(stage, **labels):
+        instrument = WebInstrument.__active__
+        if instrument is None: return WebInstrument.__idle__
+        return WebMeasurement(instrument, stage, labels)
+
+    @staticmethod
+    def count(name, **labels):
+        instrument = WebInstrument.__active__
+        if instrument is not None: instrument.increment(name, labels)
+
+    @property
+    def callbacks(self): return self.__callbacks
+
+
@@ -7,17 +7,95 @@ Created on Mon Dec 30 2019
 """
 
 import time
+import queue
+import inspect
+import threading
 from abc import ABC, abstractmethod
 
 from support.mixins import Logging, Mixin
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebELMTPage", "WebJSONPage", "WebHTMLPage", "WebStream"]
+__all__ = ["WebELMTPage", "WebJSONPage", "WebHTMLPage", "WebStream", "WebPipeline"]
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = "MIT License"
 
 
+class WebPipeline(object):
+    __sentinel__ = object()
+
+    def __init__(self, *args, stages, capacity=100, interval=0.1, **kwargs):
+        super().__init__(*args, **kwargs)
+        stages = [stage if isinstance(stage, tuple) else (stage, 1) for stage in stages]
+        self.__stages = [(function, max(int(workers), 1)) for function, workers in stages]
+        self.__interval = float(interval)
+        self.__capacity = int(capacity)
+
+    def __call__(self, feed):
+        queues = [queue.Queue(maxsize=self.capacity) for _ in range(len(self.stages) + 1)]
+        stop, errors, threads = threading.Event(), list(), list()
+        threads.append(threading.Thread(target=self.feeder, args=(feed, queues[0], stop, errors), daemon=True))
+        for index, (function, workers) in enumerate(self.stages):
+            remaining = [workers, threading.Lock()]
+            parameters = (function, queues[index], queues[index + 1], remaining, stop, errors)
+            threads.extend([threading.Thread(target=self.worker, args=parameters, daemon=True) for _ in range(workers)])
+        for thread in threads: thread.start()
+        try:
+            while not stop.is_set():
+                try: content = queues[-1].get(timeout=self.interval)
+                except queue.Empty: continue
+                if content is self.__sentinel__: break
+                yield content
+        finally:
+            stop.set()
+            for thread in threads: thread.join()
+        if bool(errors): raise errors[0]
+
+    def feeder(self, feed, destination, stop, errors):
+        try:
+            for content in feed:
+                if not self.put(destination, content, stop): return
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+        self.put(destination, self.__sentinel__, stop)
+
+    def worker(self, function, source, destination, remaining, stop, errors):
+        while not stop.is_set():
+            try: content = source.get(timeout=self.interval)
+            except queue.Empty: continue
+            if content is self.__sentinel__:
+                self.put(source, content, stop)
+                break
+            try:
+                results = function(content)
+                results = results if inspect.isgenerator(results) else ([results] if results is not None else [])
+                for result in results:
+                    if not self.put(destination, result, stop): return
+            except BaseException as error:
+                errors.append(error)
+                stop.set()
+                return
+        with remaining[1]:
+            remaining[0] = remaining[0] - 1
+            finished = remaining[0] == 0
+        if finished: self.put(destination, self.__sentinel__, stop)
+
+    def put(self, destination, content, stop):
+        while not stop.is_set():
+            try: destination.put(content, timeout=self.interval)
+            except queue.Full: continue
+            return True
+        return False
+
+    @property
+    def stages(self): return self.__stages
+    @property
+    def capacity(self): return self.__capacity
+    @property
+    def interval(self): return self.__interval
+
+
 class WebStream(Mixin, ABC):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -26,10 +104,24 @@ class WebStream(Mixin, ABC):
 
     def __init__(self, *args, source, account=None, authenticator=None, capacity=100, **kwargs):
         super().__init__(*args, **kwargs)
+        lease = source.lease() if hasattr(source, "lease") else None
+        source = lease if lease is not None else source
         parameters = dict(source=source, account=account, authenticator=authenticator)
         self.__pages = {key: value(**parameters) for key, value in self.Pages.items()}
         self.__page = self.Page(**parameters) if self.Page is not None else None
         self.__capacity = int(capacity)
+        self.__lease = lease
+
+    def __enter__(self):
+        if self.lease is not None: self.lease.acquire()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        if self.lease is not None: self.lease.release()
+
+    def pipeline(self, feed, *stages):
+        pipeline = WebPipeline(stages=stages, capacity=self.capacity)
+        return pipeline(feed)
 
     @property
     def Pages(self): return type(self).__Pages__
@@ -39,6 +131,8 @@ class WebStream(Mixin, ABC):
     @property
     def capacity(self): return self.__capacity
     @property
+    def lease(self): return self.__lease
+    @property
     def pages(self): return self.__pages
     @property
     def page(self): return self.__page
@@ -66,22 +160,22 @@ class WebPage(Logging, ABC):
 
 
 class WebJSONPage(WebPage, ABC):
-    def load(self, url, *args, payload=None, **kwargs):
+    def load(self, url, *args, payload=None, stream=False, **kwargs):
         self.console("Loading", str(url))
-        self.source.load(url, *args, payload=payload, **kwargs)
-        self.console("Loaded", f"JSON|statuscode|{str(self.source.status)}")
-        return self.source.json
+        response = self.source.load(url, *args, payload=payload, stream=stream, **kwargs)
+        self.console("Loaded", f"JSON|statuscode|{str(response.status)}")
+        return response.json if not bool(stream) else response
 
     @property
     def json(self): return self.source.json
 
 
 class WebHTMLPage(WebPage, ABC):
-    def load(self, url, *args, payload=None, **kwargs):
+    def load(self, url, *args, payload=None, stream=False, **kwargs):
         self.console("Loading", str(url))
-        self.source.load(url, *args, payload=payload, **kwargs)
-        self.console("Loaded", f"HTML|statuscode|{str(self.source.status)}")
-        return self.source.html
+        response = self.source.load(url, *args, payload=payload, stream=stream, **kwargs)
+        self.console("Loaded", f"HTML|statuscode|{str(response.status)}")
+        return response.html if not bool(stream) else response
 
     @property
     def html(self): return self.source.html
@@ -89,7 +183,7 @@ class WebHTMLPage(WebPage, ABC):
 
 class WebELMTPage(WebPage, ABC):
     def __getattr__(self, attribute):
-        attributes = ("navigate", "pageup", "pagedown", "pagehome", "pageend", "maximize", "minimize", "refresh", "forward", "back")
+        attributes = ("navigate", "pageup", "pagedown", "pagehome", "pageend", "maximize", "minimize", "refresh", "forward", "back", "invalidate", "intercept")
         if attribute in attributes: return getattr(self.source, attribute)
         else: raise AttributeError(attribute)
 
@@ -6,13 +6,14 @@ Created on Tues May 19 2026
 
 """
 
+import json
 from abc import ABC, ABCMeta, abstractmethod
 
 from support.meta import AttributeMeta, TreeMeta
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebPayload", "WebPayloadError"]
+__all__ = ["WebPayload", "WebPayloadBuilder", "WebPayloadError"]
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = "MIT License"
 
@@ -22,6 +23,7 @@ class WebPayloadMissingError(WebPayloadError): pass
 class WebPayloadSingleError(WebPayloadError): pass
 class WebPayloadMultipleError(WebPayloadError): pass
 class WebPayloadTypingError(WebPayloadError): pass
+class WebPayloadLengthError(WebPayloadError): pass
 
 
 class WebPayloadMeta(AttributeMeta, TreeMeta, ABCMeta):
@@ -47,8 +49,25 @@ class WebPayloadMeta(AttributeMeta, TreeMeta, ABCMeta):
             instances = initialize(contents)
         return instances
 
+    def build(cls):
+        function, key = cls.compile(), cls.key
+        multiple, optional = bool(cls.multiple), bool(cls.optional)
+        default = [] if multiple else None
+        def builder(sources):
+            sources = sources.get(key, default) if key is not None else sources
+            if multiple:
+                if not isinstance(sources, list): raise WebPayloadSingleError()
+                if not optional and not sources: raise WebPayloadMissingError()
+                return [function(source) for source in sources]
+            if isinstance(sources, list): raise WebPayloadMultipleError()
+            if not optional and sources is None: raise WebPayloadMissingError()
+            return function(sources)
+        return builder
+
     @abstractmethod
     def create(cls, source): pass
+    @abstractmethod
+    def compile(cls): pass
 
     @property
     def multiple(cls): return cls.__multiple__
@@ -56,6 +75,10 @@ class WebPayloadMeta(AttributeMeta, TreeMeta, ABCMeta):
     def optional(cls): return cls.__optional__
     @property
     def locator(cls): return cls.__locator__
+    @property
+    def builder(cls):
+        if "__builder__" not in vars(cls): cls.__builder__ = WebPayloadBuilder(cls)
+        return vars(cls)["__builder__"]
 
 
 class WebPayloadMappingMeta(WebPayloadMeta):
@@ -70,6 +93,14 @@ class WebPayloadMappingMeta(WebPayloadMeta):
         static = dict(cls.mapping)
         return dynamic | static
 
+    def compile(cls):
+        builders = [(dependent.locator, dependent.build()) for dependent in cls.dependents.values()]
+        static = dict(cls.mapping)
+        def function(source):
+            if not isinstance(source, dict): raise WebPayloadTypingError()
+            return {locator: builder(source) for locator, builder in builders} | static
+        return function
+
     @property
     def mapping(cls): return cls.__mapping__
 
@@ -82,6 +113,10 @@ class WebPayloadValueMeta(WebPayloadMeta):
     def create(cls, source):
         return cls.parser(source)
 
+    def compile(cls):
+        parser = cls.parser
+        return lambda source: str(parser(source))
+
     @property
     def parser(cls): return cls.__parser__
 
@@ -91,4 +126,28 @@ class WebPayloadMapping(WebPayload, dict, attribute="Mapping", metaclass=WebPayl
 class WebPayloadValue(WebPayload, str, attribute="Value", metaclass=WebPayloadValueMeta): pass
 
 
+class WebPayloadBuilder(object):
+    def __init__(self, payload, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__function = payload.build()
+        self.__payload = payload
+
+    def __repr__(self): return f"{type(self).__name__}({self.payload.__name__})"
+    def __call__(self, source): return self.function(source)
+
+    def batch(self, columns, *args, encode=False, **kwargs):
+        if hasattr(columns, "notna"): columns = columns.astype(object).where(columns.notna(), None).to_dict("list")
+        columns = {key: list(values) for key, values in dict(columns).items()}
+        if len(set(map(len, columns.values()))) > 1: raise WebPayloadLengthError()
+        keys, function = list(columns.keys()), self.function
+        payloads = [function(dict(zip(keys, values))) for values in zip(*columns.values())]
+        return [self.encode(payload) for payload in payloads] if bool(encode) else payloads
+
+    @staticmethod
+    def encode(payload): return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    @property
+    def function(self): return self.__function
+    @property
+    def payload(self): return self.__payload
 
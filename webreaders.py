@@ -6,17 +6,30 @@ Created on Sat Mar 23 2019
 
 """
 
+import json
+import time
+import random
+import asyncio
+import threading
 import requests
 import lxml.html
 from pprint import pformat
-from types import NoneType
+from functools import cached_property
+from contextlib import nullcontext
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from types import NoneType, SimpleNamespace
 
 from webscraping.websources import WebSource, WebDelayer
+from webscraping.webcaches import WebCache
+from webscraping.webinstruments import WebInstrument
 from support.meta import RegistryMeta
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebReader", "WebStatusError"]
+__all__ = ["WebReader", "WebAsyncReader", "WebResponse", "WebStreamedResponse", "WebRetry", "WebStatusError", "WebCircuitError"]
 __copyright__ = "Copyright 2026, Jack Kirby Cook"
 __license__ = "MIT License"
 
@@ -25,6 +38,7 @@ class WebStatusErrorMeta(RegistryMeta):
     def __init__(cls, *args, **kwargs):
         super(WebStatusErrorMeta, cls).__init__(*args, **kwargs)
         cls.__title__ = kwargs.get("title", getattr(cls, "__title__", None))
+        cls.__retry__ = kwargs.get("retry", getattr(cls, "__retry__", False))
 
     def __call__(cls, statuscode, *args, **kwargs):
         error = super(WebStatusErrorMeta, cls[statuscode]).__call__(*args, **kwargs)
@@ -34,6 +48,8 @@ class WebStatusErrorMeta(RegistryMeta):
     def title(cls): return cls.__title__
     @property
     def name(cls): return cls.__name__
+    @property
+    def retry(cls): return cls.__retry__
 
 class WebStatusError(Exception, metaclass=WebStatusErrorMeta):
     def __init_subclass__(cls, *args, **kwargs): pass
@@ -42,50 +58,185 @@ class BadRequestError(WebStatusError, register=400, title="BadRequest"): pass
 class AuthenticationError(WebStatusError, register=401, title="Authentication"): pass
 class ForbiddenRequestError(WebStatusError, register=403, title="ForbiddenRequest"): pass
 class IncorrectRequestError(WebStatusError, register=404, title="IncorrectRequest"): pass
-class GatewayError(WebStatusError, register=502, title="Gateway"): pass
-class UnavailableError(WebStatusError, register=503, title="Unavailable"): pass
+class TooManyRequestsError(WebStatusError, register=429, title="TooManyRequests", retry=True): pass
+class GatewayError(WebStatusError, register=502, title="Gateway", retry=True): pass
+class UnavailableError(WebStatusError, register=503, title="Unavailable", retry=True): pass
+class GatewayTimeoutError(WebStatusError, register=504, title="GatewayTimeout", retry=True): pass
+
+class WebCircuitError(Exception): pass
+
+
+class WebRetry(object):
+    def __init__(self, *args, attempts=5, backoff=1, maximum=60, jitter=0.5, threshold=5, cooldown=60, slowdown=2, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__attempts = int(attempts)
+        self.__backoff = float(backoff)
+        self.__maximum = float(maximum)
+        self.__jitter = float(jitter)
+        self.__threshold = int(threshold)
+        self.__cooldown = float(cooldown)
+        self.__slowdown = float(slowdown)
+        self.__mutex = threading.Lock()
+        self.__breakers = dict()
+        self.__metrics = dict()
+
+    def check(self, domain):
+        with self.mutex: failures, opened = self.breakers.get(domain, (0, None))
+        if opened is not None and time.monotonic() < opened: raise WebCircuitError(str(domain))
+
+    def success(self, domain):
+        with self.mutex: self.breakers.pop(domain, None)
+
+    def failure(self, domain, attempt, headers):
+        exponential = min(self.backoff * (2 ** int(attempt)), self.maximum)
+        exponential = exponential * random.uniform(1 - self.jitter, 1)
+        delay = max(exponential, self.after(headers))
+        with self.mutex:
+            failures, previous = self.breakers.get(domain, (0, None))
+            current, failures = time.monotonic(), failures + 1
+            opened = (current + self.cooldown) if failures >= self.threshold else None
+            tripped = opened is not None and (previous is None or previous <= current)
+            self.breakers[domain] = (failures, opened)
+            metrics = self.metrics.setdefault(domain, dict(retries=0, waited=0.0, trips=0))
+            metrics["retries"] = metrics["retries"] + 1
+            metrics["waited"] = metrics["waited"] + delay
+            metrics["trips"] = metrics["trips"] + int(tripped)
+        return delay
+
+    def after(self, headers):
+        value = CaseInsensitiveDict(headers).get("Retry-After", None)
+        if value is None: return 0
+        try: return min(max(float(value), 0), self.maximum)
+        except ValueError: pass
+        try: seconds = (parsedate_to_datetime(str(value)) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError): return 0
+        return min(max(seconds, 0), self.maximum)
+
+    @property
+    def attempts(self): return self.__attempts
+    @property
+    def backoff(self): return self.__backoff
+    @property
+    def maximum(self): return self.__maximum
+    @property
+    def jitter(self): return self.__jitter
+    @property
+    def threshold(self): return self.__threshold
+    @property
+    def cooldown(self): return self.__cooldown
+    @property
+    def slowdown(self): return self.__slowdown
+    @property
+    def mutex(self): return self.__mutex
+    @property
+    def breakers(self): return self.__breakers
+    @property
+    def metrics(self): return self.__metrics
 
 
 class WebReader(WebSource):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, threadsafe=False, keepalive=True, connections=10, pools=None, retry=None, cache=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__response = None
-        self.__request = None
+        self.__connections = int(connections)
+        self.__retry = retry
+        self.__cache = cache
+        self.__threadsafe = bool(threadsafe)
+        self.__keepalive = bool(keepalive)
+        self.__pools = dict(pools) if pools is not None else dict()
+        self.__local = threading.local()
 
     def start(self):
-        self.session = requests.Session()
+        adapter = lambda size: HTTPAdapter(pool_connections=max(10, len(self.pools) + 1), pool_maxsize=int(size), pool_block=bool(self.threadsafe))
+        session = requests.Session()
+        session.mount("https://", adapter(self.connections))
+        session.mount("http://", adapter(self.connections))
+        for host, size in self.pools.items(): session.mount(str(host), adapter(size))
+        session.headers["Connection"] = "keep-alive" if bool(self.keepalive) else "close"
+        if self.cache is not None: self.cache.open()
+        if self.cassette is not None: self.cassette.open()
+        self.session = session
 
     def stop(self):
         if self.session is not None: self.session.close()
+        if self.cache is not None: self.cache.close()
+        if self.cassette is not None: self.cassette.close()
         self.session = None
         self.response = None
         self.request = None
 
-    @WebDelayer.register
     def load(self, url, *args, payload=None, **kwargs):
+        domain, attempt = WebDelayer.domain(url), 0
+        while True:
+            if self.replaying: response = self.replay(url, *args, payload=payload, **kwargs)
+            else:
+                if self.retry is not None: self.retry.check(domain)
+                response = self.fetch(url, *args, payload=payload, **kwargs)
+            if response.status == requests.codes.ok:
+                if self.replaying: return response
+                if self.retry is not None: self.retry.success(domain)
+                if self.delayer is not None: self.delayer.relieve(domain)
+                return response
+            error = WebStatusError(int(response.status))
+            if self.retry is None or not type(error).retry or attempt >= self.retry.attempts - 1:
+                response.dump()
+                raise error
+            if self.replaying:
+                attempt = attempt + 1
+                continue
+            delay = self.retry.failure(domain, attempt, response.headers)
+            if self.delayer is not None: self.delayer.penalize(domain, self.retry.slowdown)
+            response.close()
+            time.sleep(delay)
+            attempt = attempt + 1
+
+    @WebDelayer.register
+    def fetch(self, url, *args, payload=None, stream=False, **kwargs):
         assert isinstance(payload, (list, dict, NoneType))
+        if bool(stream): return self.stream(url, *args, payload=payload, **kwargs)
         address, params, headers = url
-        parameters = dict(params=params, headers=headers)
-        with self.mutex:
+        key = self.cache.key(url, payload=payload) if self.cache is not None else None
+        entry = self.cache.get(key) if self.cache is not None else None
+        parameters = dict(params=params, headers=dict(headers) | WebCache.validators(entry))
+        with (self.mutex if not self.threadsafe else nullcontext()), WebInstrument.measure("fetch", domain=address.domain) as measure:
             if payload is None: response = self.session.get(str(address), **parameters)
             else: response = self.session.post(str(address), json=payload, **parameters)
-            self.request = response.request
-            self.response = response
-        if not self.response.status_code == requests.codes.ok:
-            statuscode = self.response.status_code
-            print("\033[31m" + pformat(self.request.url) + "\033[0m")
-            print("\033[31m" + pformat(self.request.headers) + "\033[0m")
-            print("\033[31m" + pformat(self.request.body) + "\033[0m")
-            print("\033[31m" + pformat(self.response.status_code) + "\033[0m")
-            print("\033[31m" + pformat(self.request.text) + "\033[0m")
-            raise WebStatusError(int(statuscode))
+            measure(status=response.status_code, bytes=len(response.content))
+        request = response.request
+        if entry is not None and response.status_code == requests.codes.not_modified:
+            self.cache.hit(key, response.headers)
+            response = WebResponse(entry["content"], url=entry["url"], status=requests.codes.ok, headers=entry["headers"], request=request, encoding=entry["encoding"])
+        else:
+            response = WebResponse(response.content, url=response.url, status=response.status_code, headers=response.headers, request=request, encoding=response.encoding)
+            if self.cache is not None and response.status == requests.codes.ok: self.cache.put(key, response)
+        if self.recording: self.cassette.record(url, response, payload=payload)
+        self.request = request
+        self.response = response
+        return response
+
+    def stream(self, url, *args, payload=None, **kwargs):
+        address, params, headers = url
+        parameters = dict(params=params, headers=headers, stream=True)
+        with WebInstrument.measure("fetch", domain=address.domain, mode="stream") as measure:
+            if payload is None: response = self.session.get(str(address), **parameters)
+            else: response = self.session.post(str(address), json=payload, **parameters)
+            measure(status=response.status_code)
+        response = WebStreamedResponse(response)
+        self.request = response.request
+        self.response = response
+        return response
+
+    def replay(self, url, *args, payload=None, **kwargs):
+        response = self.cassette.replay(url, payload=payload)
+        self.request = None
+        self.response = response
+        return response
 
     @property
-    def html(self): return lxml.html.fromstring(self.response.content)
+    def html(self): return self.response.html
     @property
-    def json(self): return self.response.json()
+    def json(self): return self.response.json
     @property
-    def status(self): return self.response.status_code
+    def status(self): return self.response.status
     @property
     def text(self): return self.response.text
     @property
@@ -96,13 +247,175 @@ class WebReader(WebSource):
     @session.setter
     def session(self, session): self.source = session
     @property
-    def response(self): return self.__response
+    def response(self): return getattr(self.local, "response", None)
     @response.setter
-    def response(self, response): self.__response = response
+    def response(self, response): self.local.response = response
     @property
-    def request(self): return self.__request
+    def request(self): return getattr(self.local, "request", None)
     @request.setter
-    def request(self, request): self.__request = request
+    def request(self, request): self.local.request = request
+
+    @property
+    def retry(self): return self.__retry
+    @property
+    def cache(self): return self.__cache
+    @property
+    def connections(self): return self.__connections
+    @property
+    def threadsafe(self): return self.__threadsafe
+    @property
+    def keepalive(self): return self.__keepalive
+    @property
+    def pools(self): return self.__pools
+    @property
+    def local(self): return self.__local
+
+
+class WebResponse(object):
+    def __init__(self, content, *args, url, status, headers, request=None, encoding=None, **kwargs):
+        self.__encoding = encoding if encoding is not None else "utf-8"
+        self.__headers = CaseInsensitiveDict(headers)
+        self.__request = request
+        self.__content = content
+        self.__status = int(status)
+        self.__url = str(url)
 
+    def close(self): pass
+    def dump(self):
+        print("\033[31m" + pformat(getattr(self.request, "url", self.url)) + "\033[0m")
+        print("\033[31m" + pformat(dict(getattr(self.request, "headers", {}))) + "\033[0m")
+        print("\033[31m" + pformat(getattr(self.request, "body", None)) + "\033[0m")
+        print("\033[31m" + pformat(self.status) + "\033[0m")
+        print("\033[31m" + pformat(self.text) + "\033[0m")
+
+    @cached_property
+    def html(self):
+        with WebInstrument.measure("parse", format="html", status=self.status) as measure:
+            measure(bytes=len(self.content))
+            return lxml.html.fromstring(self.content)
+
+    @cached_property
+    def json(self):
+        with WebInstrument.measure("parse", format="json", status=self.status) as measure:
+            measure(bytes=len(self.content))
+            return json.loads(self.content)
+
+    @cached_property
+    def text(self): return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def encoding(self): return self.__encoding
+    @property
+    def headers(self): return self.__headers
+    @property
+    def request(self): return self.__request
+    @property
+    def content(self): return self.__content
+    @property
+    def status(self): return self.__status
+    @property
+    def url(self): return self.__url
+
+
+class WebStreamedResponse(WebResponse):
+    def __init__(self, response, *args, **kwargs):
+        parameters = dict(url=response.url, status=response.status_code, headers=response.headers, request=response.request, encoding=response.encoding)
+        super().__init__(None, *args, **parameters, **kwargs)
+        response.raw.decode_content = True
+        self.__response = response
+
+    def __enter__(self): return self
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.close()
+
+    def close(self): self.response.close()
+
+    @cached_property
+    def content(self): return self.response.content
+    @property
+    def raw(self): return self.response.raw
+    @property
+    def response(self): return self.__response
+
+
+class WebAsyncReader(WebSource):
+    def __init__(self, *args, concurrency=10, retry=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__concurrency = int(concurrency)
+        self.__retry = retry
+        self.__semaphore = None
+
+    def __enter__(self): raise TypeError(f"{type(self).__name__} requires 'async with'")
+    def __exit__(self, error_type, error_value, error_traceback): pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, error_type, error_value, error_traceback):
+        await self.stop()
+
+    async def start(self):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        import aiohttp
+        self.session = aiohttp.ClientSession()
+
+    async def stop(self):
+        if self.session is not None: await self.session.close()
+        self.semaphore = None
+        self.session = None
+
+    async def load(self, url, *args, payload=None, **kwargs):
+        domain, attempt = WebDelayer.domain(url), 0
+        while True:
+            if self.retry is not None: self.retry.check(domain)
+            response = await self.fetch(url, *args, payload=payload, **kwargs)
+            if response.status == requests.codes.ok:
+                if self.retry is not None: self.retry.success(domain)
+                if self.delayer is not None: self.delayer.relieve(domain)
+                return response
+            error = WebStatusError(int(response.status))
+            if self.retry is None or not type(error).retry or attempt >= self.retry.attempts - 1:
+                response.dump()
+                raise error
+            delay = self.retry.failure(domain, attempt, response.headers)
+            if self.delayer is not None: self.delayer.penalize(domain, self.retry.slowdown)
+            await asyncio.sleep(delay)
+            attempt = attempt + 1
+
+    @WebDelayer.register
+    async def fetch(self, url, *args, payload=None, **kwargs):
+        assert isinstance(payload, (list, dict, NoneType))
+        address, params, headers = url
+        parameters = dict(params=dict(params), headers=dict(headers))
+        method = "GET" if payload is None else "POST"
+        async with self.semaphore:
+            with WebInstrument.measure("fetch", domain=address.domain) as measure:
+                async with self.session.request(method, str(address), json=payload, **parameters) as response:
+                    content = await response.read()
+                    measure(status=response.status, bytes=len(content))
+                    request = SimpleNamespace(url=str(response.request_info.url), headers=dict(response.request_info.headers), body=payload)
+                    response = WebResponse(content, url=response.url, status=response.status, headers=response.headers, request=request, encoding=response.charset)
+        return response
+
+    async def load_many(self, urls, *args, payloads=None, errors=False, **kwargs):
+        urls = list(urls)
+        payloads = list(payloads) if payloads is not None else [None] * len(urls)
+        assert len(urls) == len(payloads)
+        loads = [self.load(url, *args, payload=payload, **kwargs) for url, payload in zip(urls, payloads)]
+        return await asyncio.gather(*loads, return_exceptions=bool(errors))
+
+    @property
+    def session(self): return self.source
+    @session.setter
+    def session(self, session): self.source = session
+    @property
+    def semaphore(self): return self.__semaphore
+    @semaphore.setter
+    def semaphore(self, semaphore): self.__semaphore = semaphore
+    @property
+    def concurrency(self): return self.__concurrency
+    @property
+    def retry(self): return self.__retry
 
 
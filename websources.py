@@ -7,54 +7,114 @@ Created on Sat Feb 28 2026
 """
 
 import time
+import asyncio
+import inspect
+import threading
 import multiprocessing
+from numbers import Number
 from abc import ABC, abstractmethod
 from functools import update_wrapper
 
+from webscraping.webinstruments import WebInstrument
+
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ["WebSource", "WebDelayer"]
+__all__ = ["WebSource", "WebDelayer", "WebBuckets"]
 __copyright__ = "Copyright 2026, Jack Kirby Cook"
 __license__ = "MIT License"
 
 
-class WebDelayer(object):
-    def __init__(self, *args, delay, **kwargs):
+class WebBuckets(object):
+    def __init__(self, *args, buckets=None, mutex=None, **kwargs):
         super().__init__(*args, **kwargs)
-        assert isinstance(delay, int)
-        self.__timer = time.monotonic()
-        self.__delay = int(delay)
+        self.__buckets = buckets if buckets is not None else dict()
+        self.__mutex = mutex if mutex is not None else threading.Lock()
+
+    def reserve(self, key, rate, burst):
+        if rate == float("inf"): return 0
+        with self.mutex:
+            current = time.monotonic()
+            tokens, timestamp = self.buckets.get(key, (float(burst), current))
+            tokens = min(float(burst), tokens + (current - timestamp) * rate) - 1
+            self.buckets[key] = (tokens, current)
+        return max(- tokens / rate, 0)
+
+    def peek(self, key, rate, burst):
+        if rate == float("inf"): return 0
+        with self.mutex:
+            current = time.monotonic()
+            tokens, timestamp = self.buckets.get(key, (float(burst), current))
+            tokens = min(float(burst), tokens + (current - timestamp) * rate)
+        return max((1 - tokens) / rate, 0)
+
+    @classmethod
+    def shared(cls, manager): return cls(buckets=manager.dict(), mutex=manager.Lock())
 
-    def __enter__(self):
-        elapsed = time.monotonic() - self.timer
-        delay = max(self.delay - elapsed, 0)
-        time.sleep(delay)
-        return self
+    @property
+    def buckets(self): return self.__buckets
+    @property
+    def mutex(self): return self.__mutex
 
-    def __exit__(self, error_type, error_value, error_traceback):
-        self.timer = time.monotonic()
+
+class WebDelayer(object):
+    def __init__(self, *args, delay=None, rate=None, burst=1, backend=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        assert (delay is None) != (rate is None)
+        assert isinstance(delay if delay is not None else rate, Number)
+        if rate is None: rate = (1 / float(delay)) if bool(delay) else float("inf")
+        self.__backend = backend if backend is not None else WebBuckets()
+        self.__burst = max(int(burst), 1)
+        self.__rate = float(rate)
+        self.__penalties = dict()
+
+    def reserve(self, domain): return self.backend.reserve(domain, self.rate / self.penalties.get(domain, 1), self.burst)
+    def ready(self, domain): return self.backend.peek(domain, self.rate / self.penalties.get(domain, 1), self.burst)
+    def penalize(self, domain, factor, limit=64): self.penalties[domain] = min(self.penalties.get(domain, 1) * float(factor), float(limit))
+    def relieve(self, domain): self.penalties.pop(domain, None)
+    def acquire(self, domain):
+        delay = self.reserve(domain)
+        if not bool(delay): return
+        with WebInstrument.measure("delay", domain=domain): time.sleep(delay)
+
+    async def wait(self, domain):
+        delay = self.reserve(domain)
+        if not bool(delay): return
+        with WebInstrument.measure("delay", domain=domain): await asyncio.sleep(delay)
 
     @staticmethod
     def register(method):
         def wrapper(instance, *args, **kwargs):
-            if instance.delayer is None: return method(instance, *args, **kwargs)
-            with instance.delayer: return method(instance, *args, **kwargs)
+            if instance.delayer is not None: instance.delayer.acquire(WebDelayer.domain(*args, **kwargs))
+            return method(instance, *args, **kwargs)
+        async def coroutine(instance, *args, **kwargs):
+            if instance.delayer is not None: await instance.delayer.wait(WebDelayer.domain(*args, **kwargs))
+            return await method(instance, *args, **kwargs)
+        wrapper = coroutine if inspect.iscoroutinefunction(method) else wrapper
         update_wrapper(wrapper, method)
         return wrapper
 
+    @staticmethod
+    def domain(*args, **kwargs):
+        url = args[0] if bool(args) else kwargs.get("url", None)
+        address = getattr(url, "address", None)
+        return getattr(address, "domain", None)
+
+    @property
+    def backend(self): return self.__backend
     @property
-    def delay(self): return self.__delay
+    def burst(self): return self.__burst
     @property
-    def timer(self): return self.__timer
-    @timer.setter
-    def timer(self, timer): self.__timer = timer
+    def rate(self): return self.__rate
+    @property
+    def penalties(self): return self.__penalties
 
 
 class WebSource(ABC):
     def __bool__(self): return self.source is not None
-    def __init__(self, *args, delay=None, **kwargs):
+    def __init__(self, *args, delay=None, delayer=None, cassette=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__delayer = WebDelayer(delay=delay) if delay is not None else None
+        self.__cassette = cassette
+        self.__delayer = delayer if delayer is not None else (WebDelayer(delay=delay) if delay is not None else None)
         self.__mutex = multiprocessing.Lock()
         self.__timer = time.monotonic()
         self.__source = None
@@ -81,5 +141,11 @@ class WebSource(ABC):
     def mutex(self): return self.__mutex
     @property
     def delayer(self): return self.__delayer
+    @property
+    def cassette(self): return self.__cassette
+    @property
+    def replaying(self): return self.cassette is not None and bool(self.cassette.replaying)
+    @property
+    def recording(self): return self.cassette is not None and bool(self.cassette.recording)
 
 
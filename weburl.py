@@ -6,8 +6,11 @@ Created on Fri Mar 20 2026
 
 """
 
+import weakref
 from dataclasses import dataclass
-from collections import OrderedDict as ODict
+from functools import cached_property
+from collections.abc import Mapping
+from urllib.parse import urlencode, quote
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -18,47 +21,100 @@ __license__ = "MIT License"
 
 @dataclass(frozen=True)
 class WebAddress:
-    domain: str; path: list
+    domain: str; path: tuple
 
-    def __str__(self):
-        return "/".join([self.domain, "/".join(self.path)])
+    def __post_init__(self):
+        object.__setattr__(self, "path", tuple(map(str, self.path)))
 
+    def __hash__(self): return self.hashed
+    def __str__(self): return self.string
 
-class WebHeaders(ODict): pass
-class WebParameters(ODict):
-    def __str__(self):
-        parameters = [list(map(str, parameter)) for parameter in self.items()]
-        return str("&").join([str("=").join(parameter) for parameter in parameters])
+    @cached_property
+    def string(self): return "/".join([self.domain, "/".join(self.path)])
+    @cached_property
+    def hashed(self): return hash((self.domain, self.path))
+
+
+class WebMapping(Mapping):
+    def __init__(self, contents=(), **kwargs):
+        contents = dict(contents) | dict(kwargs)
+        freeze = lambda value: tuple(value) if isinstance(value, (list, tuple)) else value
+        self.__contents = tuple(sorted([(str(key), freeze(value)) for key, value in contents.items()]))
+        self.__mapping = dict(self.__contents)
+        self.__hashed = hash((type(self).__name__, self.__contents))
+
+    def __repr__(self): return f"{type(self).__name__}({dict(self.contents)!r})"
+    def __getitem__(self, key): return self.mapping[key]
+    def __iter__(self): return iter(self.mapping)
+    def __len__(self): return len(self.contents)
+    def __hash__(self): return self.hashed
+    def __eq__(self, other):
+        if isinstance(other, WebMapping): return type(self) is type(other) and self.contents == other.contents
+        return isinstance(other, Mapping) and self.mapping == dict(other)
+
+    @property
+    def contents(self): return self.__contents
+    @property
+    def mapping(self): return self.__mapping
+    @property
+    def hashed(self): return self.__hashed
+
+
+class WebHeaders(WebMapping): pass
+class WebParameters(WebMapping):
+    def __str__(self): return self.string
+
+    @cached_property
+    def string(self): return urlencode(list(self.contents), doseq=True, quote_via=quote)
 
 
 @dataclass(frozen=True)
 class WebCURL:
-    address: WebAddress; parameters: WebParameters | dict; headers: WebHeaders | dict
+    address: WebAddress; parameters: WebParameters; headers: WebHeaders
+    __interned__ = weakref.WeakValueDictionary()
+
+    def __post_init__(self):
+        if not isinstance(self.parameters, WebParameters): object.__setattr__(self, "parameters", WebParameters(self.parameters))
+        if not isinstance(self.headers, WebHeaders): object.__setattr__(self, "headers", WebHeaders(self.headers))
 
     def __iter__(self):
         yield self.address; yield self.parameters; yield self.headers
 
-    def __str__(self):
+    def __hash__(self): return self.hashed
+    def __str__(self): return self.string
+
+    @classmethod
+    def intern(cls, curl): return cls.__interned__.setdefault(curl.identity, curl)
+
+    @property
+    def identity(self): return tuple([self.address.domain, self.address.path, self.parameters.contents, self.headers.contents])
+
+    @cached_property
+    def string(self):
         parameters = (str("?") + str(self.parameters)) if bool(self.parameters) else str("")
         return str(self.address) + str(parameters)
 
+    @cached_property
+    def hashed(self): return hash((self.address, self.parameters, self.headers))
+
 
 class WebURL(object):
     def __init_subclass__(cls, *args, **kwargs):
         domain = kwargs.get("domain", getattr(cls, "attributes", {}).get("domain", None))
-        path = getattr(cls, "attributes", {}).get("path", []) + kwargs.get("path", [])
+        path = tuple(getattr(cls, "attributes", {}).get("path", ())) + tuple(kwargs.get("path", ()))
         parameters = getattr(cls, "attributes", {}).get("parameters", {}) | kwargs.get("parameters", {})
         headers = getattr(cls, "attributes", {}).get("headers", {}) | kwargs.get("headers", {})
-        cls.attributes = dict(domain=domain, path=path, parameters=parameters, headers=headers)
+        interned = kwargs.get("intern", getattr(cls, "attributes", {}).get("intern", False))
+        cls.attributes = dict(domain=domain, path=path, parameters=parameters, headers=headers, intern=bool(interned))
 
     def __new__(cls, *args, **kwargs):
         domain = cls.attributes["domain"]
-        path = cls.attributes["path"] + cls.path(*args, **kwargs)
+        path = cls.attributes["path"] + tuple(cls.path(*args, **kwargs))
         parameters = cls.attributes["parameters"] | cls.parameters(*args, **kwargs)
         headers = cls.attributes["headers"] | cls.headers(*args, **kwargs)
         address = WebAddress(domain, path)
-        parameters = WebParameters(parameters.items())
-        return WebCURL(address, parameters, headers)
+        curl = WebCURL(address, WebParameters(parameters), WebHeaders(headers))
+        return WebCURL.intern(curl) if bool(cls.attributes["intern"]) else curl
 
     @staticmethod
     def path(*args, **kwargs): return []
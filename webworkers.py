@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   WebWorker Objects
+@author: Jack Kirby Cook
+
+"""
+
+import json
+import lxml.html
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from webscraping.webdatas import WebDataMeta, WebHTMLData, WebJSONData
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ["WebWorkers"]
+__copyright__ = "Copyright 2026, Jack Kirby Cook"
+__license__ = "MIT License"
+
+
+class WebWorkers(object):
+    def __init__(self, *args, workers=None, context="spawn", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__workers = int(workers) if workers is not None else None
+        self.__context = str(context)
+        self.__executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, error_type, error_value, error_traceback):
+        self.stop()
+
+    def __call__(self, datatype, response, *args, **kwargs):
+        return self.submit(datatype, response, *args, **kwargs).result()
+
+    def start(self):
+        context = multiprocessing.get_context(self.context)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def stop(self):
+        if self.executor is not None: self.executor.shutdown(wait=True, cancel_futures=True)
+        self.executor = None
+
+    def submit(self, datatype, response, *args, **kwargs):
+        if issubclass(datatype, WebHTMLData): kind = "html"
+        elif issubclass(datatype, WebJSONData): kind = "json"
+        else: raise TypeError(datatype)
+        content = bytes(getattr(response, "content", response))
+        return self.executor.submit(WebWorkers.extract, datatype.address, kind, content, *args, **kwargs)
+
+    def map(self, datatype, responses, *args, **kwargs):
+        futures = [self.submit(datatype, response, *args, **kwargs) for response in responses]
+        for future in futures: yield future.result()
+
+    @staticmethod
+    def extract(address, kind, content, *args, **kwargs):
+        datatype = WebDataMeta.resolve(address)
+        document = lxml.html.fromstring(content) if kind == "html" else json.loads(content)
+        instances = datatype(document, *args, **kwargs)
+        if isinstance(instances, list): return [instance(*args, **kwargs) for instance in instances]
+        else: return instances(*args, **kwargs)
+
+    @property
+    def executor(self): return self.__executor
+    @executor.setter
+    def executor(self, executor): self.__executor = executor
+    @property
+    def workers(self): return self.__workers
+    @property
+    def context(self): return self.__context
+
+